@@ -6,10 +6,10 @@ Extracted from __script_v9.py
 
 import re
 import unicodedata
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
 
 import pandas as pd
-import phonenumbers
 from nameparser import HumanName
 
 # Field mapping: maps various column name aliases to standardized field names
@@ -60,6 +60,58 @@ FIELD_MAPPING = {
     "personal_birthday": ["personal_birthday", "birthday", "dob", "cumpleaños", "fecha nacimiento"]
 }
 
+# Fields whose values are always lowercased (emails, URLs, social handles)
+LOWERCASE_FIELDS = frozenset({
+    "email", "business_url", "personal_url", "business_linkedin",
+    "social_instagram", "social_twitter", "social_facebook",
+})
+
+# Fields that need smart title case (keep articles lowercase)
+SMART_TITLE_FIELDS = frozenset({
+    "address_street", "address_city", "address_state", "address_country",
+    "business_title", "business_department",
+    "business_address_street", "business_address_city",
+    "business_address_state", "business_address_country",
+})
+
+# Common Spanish and English articles/prepositions smart_title_case keeps lowercase
+SMART_TITLE_LOWERCASE_WORDS = frozenset({
+    # Spanish
+    'de', 'del', 'la', 'las', 'los', 'y', 'el', 'un', 'una', 'unos', 'unas',
+    'en', 'con', 'sin', 'por', 'para', 'desde', 'hasta',
+    # English
+    'a', 'an', 'the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for',
+    'with', 'from', 'by', 'as', 'is', 'was', 'are', 'were'
+})
+
+# Compiled once at import: these run per cell/row on every batch.
+_PAREN_RE = re.compile(r'\([^)]+\)')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+_INITIALS_CHARS_RE = re.compile(r"^[A-Za-zÀ-ÿ.]+$")
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'\D')
+# format_field swaps "(...)" groups for NUL-delimited placeholders like "\x000\x00"
+# before title-casing: they contain no cased letters, so title()/capitalize()/lower()
+# leave them untouched and they can be restored verbatim.
+_PAREN_PLACEHOLDER = "\x00{}\x00"
+# Values plain str.title() can't handle on its own: parentheses to preserve, or tokens
+# that may be initials ("J.P.", a lone "A") which _title_preserve_initials keeps as-is.
+_NEEDS_ROW_FORMAT_RE = re.compile(r'[(.]|(?:^|\s)[A-Za-zÀ-ÿ](?:\s|$)')
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that deletes combining marks (category Mn) — the accents
+    left behind by NFD. Filled lazily per code point, so the category lookup runs once
+    per distinct character instead of once per character per call."""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_COMBINING_MARKS = _CombiningMarkTable()
+
 # Minimum alias-token length considered for substring (fuzzy) header matching. Keeps
 # short tokens like "x"/"li"/"fb" restricted to exact-token matches only, avoiding false
 # positives on unrelated headers that merely contain those letters.
@@ -71,10 +123,15 @@ def _normalize_header_token(text: str) -> str:
     token matching (mirrors demoSpreadsheetParser.ts normalizeHeaderKey, but keeps word
     boundaries as spaces instead of underscores)."""
     text = str(text).lower().strip()
-    text = ''.join(
-        c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn'
-    )
-    return re.sub(r'[^a-z0-9]+', ' ', text).strip()
+    text = unicodedata.normalize('NFD', text).translate(_COMBINING_MARKS)
+    return _NON_ALNUM_RE.sub(' ', text).strip()
+
+
+@lru_cache(maxsize=8192)
+def _normalize_word(word: str) -> str:
+    """Normalize word by removing accents for matching. Cached: the same name tokens
+    ("jose", "maria", ...) recur on almost every row of a batch."""
+    return unicodedata.normalize('NFD', word.lower()).translate(_COMBINING_MARKS)
 
 
 def _alias_tokens(aliases) -> set:
@@ -90,11 +147,8 @@ def _canonical_header_key(text: str) -> str:
     characters (spaces, underscores, hyphens) collapsed to a single underscore — exactly
     like demoSpreadsheetParser.ts normalizeHeaderKey. Makes `business_address_street`,
     "Business Address Street" and "BUSINESS_ADDRESS_STREET" all identical."""
-    return re.sub(
-        r'[^a-z0-9]+', '_', ''.join(
-            c for c in unicodedata.normalize('NFD', str(text).lower())
-            if unicodedata.category(c) != 'Mn'
-        )
+    return _NON_ALNUM_RE.sub(
+        '_', unicodedata.normalize('NFD', str(text).lower()).translate(_COMBINING_MARKS)
     ).strip('_')
 
 
@@ -107,6 +161,15 @@ for _field, _aliases in FIELD_MAPPING.items():
         CANONICAL_FIELD_MAP.setdefault(_canonical_header_key(_alias), _field)
 
 
+# Exact alias map: lowercased FIELD_MAPPING alias -> (field, position in that field's
+# alias list). Lets map_row resolve each header with one dict lookup while still
+# preferring the alias listed first when several headers hit the same field.
+ALIAS_FIELD_MAP: Dict[str, Tuple[str, int]] = {}
+for _field, _aliases in FIELD_MAPPING.items():
+    for _rank, _alias in enumerate(_aliases):
+        ALIAS_FIELD_MAP.setdefault(_alias.lower(), (_field, _rank))
+
+
 def find_fuzzy_field_match(header: str) -> Optional[str]:
     """
     Fallback for headers that don't exactly match a `FIELD_MAPPING` alias — e.g. "Teléfono
@@ -141,11 +204,95 @@ def find_fuzzy_field_match(header: str) -> Optional[str]:
     return next(iter(matched_fields)) if len(matched_fields) == 1 else None
 
 
+def _is_missing(value: Any) -> bool:
+    """Scalar-only stand-in for pd.isna on the per-cell hot paths: None, pandas NA/NaT
+    and any NaN/NaT scalar, Python or numpy (the only values not equal to themselves).
+    Skips pd.isna's generic dispatch for the common case of a plain string cell."""
+    if isinstance(value, str):
+        return False
+    return (
+        value is None
+        or value is pd.NA
+        or value is pd.NaT
+        or bool(value != value)
+    )
+
+
+def _keep_as_is(text: str) -> str:
+    return text
+
+
+def _restore_parens(text: str, originals: Dict[str, str]) -> str:
+    """Swap every placeholder in `text` back to its original "(...)" content. The
+    placeholders survive title-casing unchanged, so plain replace() finds them."""
+    for placeholder, original in originals.items():
+        text = text.replace(placeholder, original)
+    return text
+
+
+@lru_cache(maxsize=16384)
+def _normalize_phone_cached(
+    raw_str: str,
+    phone_type: str,
+    work_phone_prefix: Optional[str],
+    default_country_code: Optional[str]
+) -> str:
+    """Rules 1-6 of DataNormalizer.normalize_phone on an already-cleaned string.
+    Cached because shared office lines repeat on many rows of the same batch."""
+    # Rule 1: Preserve E.164 formatted numbers completely unchanged
+    if raw_str.startswith("+"):
+        return raw_str
+
+    # Extract digits only for logic checks
+    digits = _NON_DIGIT_RE.sub('', raw_str)
+
+    # Rule 3: 1-3 digits are extensions, return as-is
+    if len(digits) <= 3:
+        return digits
+
+    # Rule 2: Apply work phone prefix for exactly 4 digits (work_phone only)
+    if phone_type == "work" and len(digits) == 4 and work_phone_prefix:
+        # Apply prefix
+        digits = work_phone_prefix + digits
+
+    # Rule 5: If not exactly 8 digits, leave unchanged (unknown country)
+    if len(digits) != 8:
+        return raw_str
+
+    # At this point, we have exactly 8 digits
+    # Rule 4: Apply default country code if provided
+    if default_country_code:
+        # Format: "+(506) XXXX-XXXX"
+        formatted = f"{default_country_code} {digits[:4]}-{digits[4:]}"
+        return formatted
+    else:
+        # No country code configured, use simple format: "XXXX-XXXX"
+        return f"{digits[:4]}-{digits[4:]}"
+
+
 class DataNormalizer:
     """
     Normalizes and formats data fields according to vCard standards
     """
 
+    # Common Spanish given names (from Costa Rica data)
+    SPANISH_GIVEN_NAMES = frozenset({
+        'jose', 'maria', 'juan', 'carlos', 'luis', 'ana', 'pedro', 'francisco',
+        'miguel', 'antonio', 'manuel', 'jesus', 'raul', 'eduardo', 'alberto',
+        'jorge', 'roberto', 'ricardo', 'fernando', 'rafael', 'andres', 'diego',
+        'daniel', 'alejandro', 'javier', 'sergio', 'pablo', 'enrique', 'ramon',
+        'sofia', 'isabel', 'carmen', 'rosa', 'laura', 'patricia', 'monica',
+        'andrea', 'cristina', 'elena', 'teresa', 'beatriz', 'silvia', 'marta',
+        'valeria', 'gabriela', 'carolina', 'paula', 'adriana', 'natalia',
+        'alexander', 'david', 'victor', 'william', 'stephanie', 'melissa',
+        'jessica', 'michael', 'kevin', 'steven', 'jonathan', 'christopher',
+        'oscar', 'gustavo', 'esteban', 'tatiana', 'viviana'
+    })
+
+    SPANISH_SURNAME_PREFIXES = frozenset({
+        'de', 'del', 'la', 'los', 'las', 'y', 'von', 'van', 'di', 'da', 'dos', 'angeles'
+    })
+
     # Initials: runs of (letter + dot) like A., j.p., J.M.A. — not "St." (two letters + dot).
     _RE_INITIALS_DOTTED = re.compile(r"^(?:[A-Za-zÀ-ÿ]\.){1,4}\.?$", re.UNICODE)
     _RE_INITIAL_LETTER = re.compile(r"^[A-Za-zÀ-ÿ]\.?$", re.UNICODE)
@@ -158,9 +305,8 @@ class DataNormalizer:
         t = token.strip()
         if not t or len(t) > 20:
             return False
-        if any(ch.isdigit() for ch in t) or "-" in t or "_" in t:
-            return False
-        if not re.match(r"^[A-Za-zÀ-ÿ.]+$", t):
+        # Also rejects digits, "-" and "_"
+        if not _INITIALS_CHARS_RE.match(t):
             return False
         if self._RE_INITIALS_DOTTED.match(t):
             return True
@@ -178,25 +324,6 @@ class DataNormalizer:
             w if self._is_initials_token(w) else w.title() for w in s.split()
         )
 
-    def __init__(self):
-        # Common Spanish given names (from Costa Rica data)
-        self.spanish_given_names = {
-            'jose', 'maria', 'juan', 'carlos', 'luis', 'ana', 'pedro', 'francisco',
-            'miguel', 'antonio', 'manuel', 'jesus', 'raul', 'eduardo', 'alberto',
-            'jorge', 'roberto', 'ricardo', 'fernando', 'rafael', 'andres', 'diego',
-            'daniel', 'alejandro', 'javier', 'sergio', 'pablo', 'enrique', 'ramon',
-            'sofia', 'isabel', 'carmen', 'rosa', 'laura', 'patricia', 'monica',
-            'andrea', 'cristina', 'elena', 'teresa', 'beatriz', 'silvia', 'marta',
-            'valeria', 'gabriela', 'carolina', 'paula', 'adriana', 'natalia',
-            'alexander', 'david', 'victor', 'william', 'stephanie', 'melissa',
-            'jessica', 'michael', 'kevin', 'steven', 'jonathan', 'christopher',
-            'oscar', 'gustavo', 'esteban', 'tatiana', 'viviana'
-        }
-
-        self.spanish_surname_prefixes = {
-            'de', 'del', 'la', 'los', 'las', 'y', 'von', 'van', 'di', 'da', 'dos', 'angeles'
-        }
-
     def smart_title_case(self, text: str) -> str:
         """
         Apply smart title case that keeps articles and prepositions lowercase
@@ -205,16 +332,6 @@ class DataNormalizer:
         Articles kept lowercase: de, del, la, las, los, y, a, an, the, of, and, or, in, on, at, to, for, with
         Always capitalize first and last word regardless
         """
-        # Common Spanish and English articles/prepositions to keep lowercase
-        lowercase_words = {
-            # Spanish
-            'de', 'del', 'la', 'las', 'los', 'y', 'el', 'un', 'una', 'unos', 'unas',
-            'en', 'con', 'sin', 'por', 'para', 'desde', 'hasta',
-            # English
-            'a', 'an', 'the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for',
-            'with', 'from', 'by', 'as', 'is', 'was', 'are', 'were'
-        }
-
         words = text.split()
         if not words:
             return text
@@ -227,77 +344,90 @@ class DataNormalizer:
             elif i == 0 or i == len(words) - 1:
                 result.append(word.capitalize())
             # Keep articles/prepositions lowercase if they're in the middle
-            elif word.lower() in lowercase_words:
+            elif word.lower() in SMART_TITLE_LOWERCASE_WORDS:
                 result.append(word.lower())
             else:
                 result.append(word.capitalize())
 
         return ' '.join(result)
 
-    def format_field(self, key: str, value: Any) -> str:
-        """Format field value according to field-specific rules"""
-        if pd.isna(value) or str(value).strip() == "":
-            return ""
-
-        text = str(value).strip()
-
-        # Rule 2: For business names don't change the letter casing
-        if key == "business_name":
-            return text
-
-        # Emails and URLs should be lowercase
-        if key in ["email", "business_url", "personal_url", "business_linkedin",
-                   "social_instagram", "social_twitter", "social_facebook"]:
-            return text.lower()
-
-        # Fields that need smart title case (keep articles lowercase)
-        smart_title_fields = [
-            "address_street", "address_city", "address_state", "address_country",
-            "business_title", "business_department",
-            "business_address_street", "business_address_city",
-            "business_address_state", "business_address_country"
-        ]
-
-        if key in smart_title_fields:
-            # Preserve text inside parentheses
-            parentheses_content = {}
-
-            def preserve_parens(match):
-                placeholder = f"__PAREN_{len(parentheses_content)}__"
-                parentheses_content[placeholder] = match.group(0)
-                return placeholder
-
-            text_with_placeholders = re.sub(r'\([^)]+\)', preserve_parens, text)
-
-            # Apply smart title case
-            formatted = self.smart_title_case(text_with_placeholders)
-
-            # Restore parentheses content with original casing
-            for placeholder, original in parentheses_content.items():
-                formatted = formatted.replace(placeholder, original)
-
-            return formatted
-
-        # Rule 3: For all other fields, apply regular Title Case
-        # BUT preserve text inside parentheses
+    def __init__(self):
+        # Formatter per field id, resolved once so format_field is a single dict lookup
+        # instead of a chain of membership tests. Fields not listed get regular Title Case.
+        #   - business_name: don't change the letter casing
+        #   - emails, URLs and social handles: lowercase
+        #   - address/title/department fields: smart title case (articles stay lowercase)
+        self._formatters: Dict[str, Callable[[str], str]] = {"business_name": _keep_as_is}
+        self._formatters.update(dict.fromkeys(LOWERCASE_FIELDS, str.lower))
+        self._formatters.update(dict.fromkeys(SMART_TITLE_FIELDS, self._smart_title_field))
+
+    # The two title-case formatters test for "(" themselves so the common case (no
+    # parentheses to preserve) is one direct call, with no placeholder round-trip.
+
+    def _smart_title_field(self, text: str) -> str:
+        if '(' not in text:
+            return self.smart_title_case(text)
+        return self._title_case_preserving_parens(text, self.smart_title_case)
+
+    def _title_field(self, text: str) -> str:
+        # Regular Title Case, without mangling initial-like tokens (e.g. "J.D.")
+        if '(' not in text:
+            return self._title_preserve_initials(text)
+        return self._title_case_preserving_parens(text, self._title_preserve_initials)
+
+    def _title_case_preserving_parens(self, text: str, title_case: Callable[[str], str]) -> str:
+        """Apply title_case to text, keeping any "(...)" groups in their original casing."""
         parentheses_content = {}
 
         def preserve_parens(match):
-            placeholder = f"__PAREN_{len(parentheses_content)}__"
+            placeholder = _PAREN_PLACEHOLDER.format(len(parentheses_content))
             parentheses_content[placeholder] = match.group(0)
             return placeholder
 
-        text_with_placeholders = re.sub(r'\([^)]+\)', preserve_parens, text)
-
-        # Apply title case (do not mangle initial-like tokens, e.g. "J.D.")
-        formatted = self._title_preserve_initials(text_with_placeholders)
+        formatted = title_case(_PAREN_RE.sub(preserve_parens, text))
 
         # Restore parentheses content with original casing
-        for placeholder, original in parentheses_content.items():
-            ph_key = self._title_preserve_initials(placeholder)
-            formatted = formatted.replace(ph_key, original)
+        return _restore_parens(formatted, parentheses_content)
 
-        return formatted
+    def format_field(self, key: str, value: Any) -> str:
+        """Format field value according to field-specific rules"""
+        if _is_missing(value):
+            return ""
+
+        text = f"{value}".strip()
+        if not text:
+            return ""
+
+        return self._formatters.get(key, self._title_field)(text)
+
+    def format_column(self, key: str, series: pd.Series) -> pd.Series:
+        """
+        Column-wise equivalent of format_field: same output per cell, but the common
+        cases run through pandas' vectorized string methods instead of one Python call
+        per row. Only smart-title fields and the few title-case values with parentheses
+        or initials fall back to format_field.
+        """
+        missing = series.isna()
+        text = series.astype(str).str.strip()
+        missing |= text.eq("")
+
+        if key == "business_name":
+            result = text
+        elif key in LOWERCASE_FIELDS:
+            result = text.str.lower()
+        elif key in SMART_TITLE_FIELDS:
+            result = text.map(lambda v: self.format_field(key, v))
+        else:
+            result = text.str.replace(_WHITESPACE_RUN_RE, ' ', regex=True).str.title()
+            # Delegated rows get the uncollapsed text: format_field keeps the spacing
+            # inside "(...)" as written
+            needs_row_format = text.str.contains(_NEEDS_ROW_FORMAT_RE) & ~missing
+            if needs_row_format.any():
+                result[needs_row_format] = text[needs_row_format].map(
+                    lambda v: self.format_field(key, v)
+                )
+
+        return result.mask(missing, "")
 
     def normalize_phone(
         self,
@@ -323,46 +453,18 @@ class DataNormalizer:
             5. Numbers with != 8 digits → left unchanged (unknown country)
             6. Final format for Costa Rica: "+(506) XXXX-XXXX"
         """
-        if pd.isna(phone_raw) or str(phone_raw).strip() == "":
+        if _is_missing(phone_raw):
             return ""
 
-        raw_str = str(phone_raw).strip()
-        if raw_str.lower() in ["nan", "none", "null"]:
+        raw_str = f"{phone_raw}".strip()
+        if not raw_str or raw_str.lower() in ["nan", "none", "null"]:
             return ""
 
-        # Rule 1: Preserve E.164 formatted numbers completely unchanged
-        if raw_str.startswith("+"):
-            return raw_str
-
-        # Extract digits only for logic checks
-        digits = "".join(filter(str.isdigit, raw_str))
-
-        # Rule 3: 1-3 digits are extensions, return as-is
-        if len(digits) <= 3:
-            return digits
-
-        # Rule 2: Apply work phone prefix for exactly 4 digits (work_phone only)
-        if phone_type == "work" and len(digits) == 4 and work_phone_prefix:
-            # Apply prefix
-            digits = work_phone_prefix + digits
-
-        # Rule 5: If not exactly 8 digits, leave unchanged (unknown country)
-        if len(digits) != 8:
-            return raw_str
-
-        # At this point, we have exactly 8 digits
-        # Rule 4: Apply default country code if provided
-        if default_country_code:
-            # Format: "+(506) XXXX-XXXX"
-            formatted = f"{default_country_code} {digits[:4]}-{digits[4:]}"
-            return formatted
-        else:
-            # No country code configured, use simple format: "XXXX-XXXX"
-            return f"{digits[:4]}-{digits[4:]}"
+        return _normalize_phone_cached(raw_str, phone_type, work_phone_prefix, default_country_code)
 
     @staticmethod
     def _digits_only(value: Any) -> str:
-        return ''.join(filter(str.isdigit, str(value))) if value else ''
+        return _NON_DIGIT_RE.sub('', str(value)) if value else ''
 
     def _looks_like_extension(self, value: Any) -> bool:
         if not value or str(value).strip().startswith('+'):
@@ -431,7 +533,7 @@ class DataNormalizer:
         """
         Parse full name into components using Spanish and international heuristics
         """
-        if pd.isna(full_name) or str(full_name).strip() == "":
+        if _is_missing(full_name):
             return {
                 "first_name": "",
                 "last_name": "",
@@ -440,10 +542,11 @@ class DataNormalizer:
                 "suffix": ""
             }
 
-        raw_name = str(full_name).strip()
+        raw_name = f"{full_name}".strip()
         name_parts = [part for part in raw_name.split() if part]
 
-        if len(name_parts) == 0:
+        n = len(name_parts)
+        if n == 0:
             return {
                 "first_name": "",
                 "last_name": "",
@@ -452,6 +555,10 @@ class DataNormalizer:
                 "suffix": ""
             }
 
+        # Accent-stripped lowercase form of the tokens the given-name checks below look
+        # at (never past the fourth), computed once and reused
+        normalized = [_normalize_word(part) for part in name_parts[:4]]
+
         first_name = ""
         last_name = ""
         title = ""
@@ -461,58 +568,29 @@ class DataNormalizer:
         is_spanish_format = False
         is_all_caps = raw_name.isupper()
 
-        if len(name_parts) >= 2:
-            first_word_norm = self._normalize_word(name_parts[0])
-
+        if n >= 2:
             # If FIRST word is a Spanish given name, it's normal order
-            if first_word_norm in self.spanish_given_names:
+            if normalized[0] in self.SPANISH_GIVEN_NAMES:
                 is_spanish_format = False
-            elif len(name_parts) == 4:
-                word2_norm = self._normalize_word(name_parts[2])
-                word3_norm = self._normalize_word(name_parts[3])
-                if word2_norm in self.spanish_given_names and word3_norm in self.spanish_given_names:
+            elif n == 4:
+                if normalized[2] in self.SPANISH_GIVEN_NAMES and normalized[3] in self.SPANISH_GIVEN_NAMES:
                     is_spanish_format = True
-            elif is_all_caps and len(name_parts) >= 3:
+            elif is_all_caps and n >= 3:
                 is_spanish_format = True
 
         if is_spanish_format:
-            # Spanish format: SURNAME1 SURNAME2 FIRSTNAME1 FIRSTNAME2
-            if len(name_parts) == 2:
-                last_name = name_parts[0]
-                first_name = name_parts[1]
-            elif len(name_parts) == 3:
-                word2_norm = self._normalize_word(name_parts[2])
-                if word2_norm in self.spanish_given_names:
-                    last_name = " ".join(name_parts[:2])
-                    first_name = name_parts[2]
-                else:
-                    last_name = " ".join(name_parts[:2])
-                    first_name = name_parts[2]
-            elif len(name_parts) >= 4:
-                # Count trailing given names
-                given_name_count = 0
-                for i in range(len(name_parts) - 1, -1, -1):
-                    word_normalized = self._normalize_word(name_parts[i])
-                    if word_normalized in self.spanish_given_names or word_normalized in self.spanish_surname_prefixes:
-                        given_name_count += 1
-                    else:
-                        break
-
-                if given_name_count >= 2:
-                    last_name = " ".join(name_parts[:2])
-                    first_name = " ".join(name_parts[2:])
-                else:
-                    last_name = " ".join(name_parts[:2])
-                    first_name = " ".join(name_parts[2:])
+            # Spanish format: SURNAME1 SURNAME2 FIRSTNAME1 [FIRSTNAME2 ...]. Detection above
+            # only flags names of 3+ tokens, and every 3- and 4+-token sub-case split the
+            # same way, so the two surnames always lead.
+            last_name = " ".join(name_parts[:2])
+            first_name = " ".join(name_parts[2:])
         else:
             # TIER 2: Normal order (FIRSTNAME LASTNAME)
-            if len(name_parts) == 3:
+            if n == 3:
                 first_name = name_parts[0]
                 last_name = " ".join(name_parts[1:])
-            elif len(name_parts) >= 4:
-                first_word_norm = self._normalize_word(name_parts[0])
-                second_word_norm = self._normalize_word(name_parts[1])
-                if first_word_norm in self.spanish_given_names and second_word_norm in self.spanish_given_names:
+            elif n >= 4:
+                if normalized[0] in self.SPANISH_GIVEN_NAMES and normalized[1] in self.SPANISH_GIVEN_NAMES:
                     first_name = " ".join(name_parts[:2])
                     last_name = " ".join(name_parts[2:])
                 else:
@@ -527,28 +605,37 @@ class DataNormalizer:
                 suffix = hn.suffix
 
                 if not first_name and not last_name:
-                    if len(name_parts) >= 2:
+                    if n >= 2:
                         first_name = name_parts[0]
                         last_name = " ".join(name_parts[1:])
                     else:
                         first_name = raw_name
                         last_name = ""
 
-        # Build proper full_name
+        first_name = self._title_preserve_initials(first_name) if first_name else ""
+        last_name = self._title_preserve_initials(last_name) if last_name else ""
+
+        # Build proper full_name from the already title-cased parts (title-casing is
+        # per word, so this equals title-casing the joined string)
         proper_full_name = f"{first_name} {last_name}".strip()
 
         return {
-            "first_name": self._title_preserve_initials(first_name) if first_name else "",
-            "last_name": self._title_preserve_initials(last_name) if last_name else "",
-            "full_name": self._title_preserve_initials(proper_full_name) if proper_full_name else self._title_preserve_initials(raw_name),
+            "first_name": first_name,
+            "last_name": last_name,
+            "full_name": proper_full_name or self._title_preserve_initials(raw_name),
             "business_title": self._title_preserve_initials(title) if title else "",
             "suffix": suffix
         }
 
-    def _normalize_word(self, word: str) -> str:
-        """Normalize word by removing accents for matching"""
-        word_lower = word.lower()
-        return ''.join(
-            c for c in unicodedata.normalize('NFD', word_lower)
-            if unicodedata.category(c) != 'Mn'
+    def parse_names(self, names: pd.Series) -> pd.DataFrame:
+        """
+        Batch parse_name over a Series: one DataFrame with a column per parse_name key,
+        aligned to names.index. Runs a plain map() over the raw values rather than
+        Series.apply, which adds pandas' per-call result inference on top.
+        """
+        records = list(map(self.parse_name, names.tolist()))
+        return pd.DataFrame.from_records(
+            records,
+            index=names.index,
+            columns=["first_name", "last_name", "full_name", "business_title", "suffix"],
         )
@@ -4,28 +4,63 @@ Handles parsing of various file formats: CSV, XLS, XLSX, TXT, JSON
 Extracted from __script_v9.py
 """
 
+import codecs
 import csv
 import os
 import json
 import logging
 import re
 import unicodedata
-from typing import List
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional
 
+import orjson
 import pandas as pd
-import chardet
+from chardet.universaldetector import UniversalDetector
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
 
 from data_normalizer import (
     FIELD_MAPPING,
+    ALIAS_FIELD_MAP,
     CANONICAL_FIELD_MAP,
     _alias_tokens,
     _normalize_header_token,
     _canonical_header_key,
+    _COMBINING_MARKS,
     find_fuzzy_field_match,
 )
 
 logger = logging.getLogger(__name__)
 
+# Vertical TXT phone line: at least 4 digits anywhere in the value
+_PHONE_LINE_RE = re.compile(r'(?:\D*\d){4}')
+
+# Column label that is really a phone number (7+ digits)
+_PHONE_LIKE_LABEL_RE = re.compile(r'(?:\D*\d){7}')
+
+# Blank-line separators between pasted sections
+_SECTION_BREAK_RE = re.compile(r'\n\s*\n+')
+
+# Full phone number (8+ digits); group 1 is its first digit. No match means the
+# value is an extension. Classifies without building the digits-only string.
+_FULL_PHONE_RE = re.compile(r'\D*(\d)(?:\D*\d){7}')
+
+# Encoding detection only looks at the start of the file
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Rows per DataFrame when streaming CSV files with iter_chunks
+PARSE_CHUNK_ROWS = 100_000
+
+# Digit-string fields read as text, so pandas never turns them into floats
+# (which drops leading zeros and appends ".0")
+TEXT_FIELDS = frozenset({
+    'work_phone', 'work_phone_ext', 'mobile_phone', 'address_postal', 'business_address_postal',
+})
+
 KEY_VALUE_LINE_RE = re.compile(r'^\s*(?P<key>[^:]+?)\s*:\s*(?P<value>.+?)\s*$')
 
 # Whitespace-separated key-value paste: "full_name    John Doe" / "full_name\tJohn Doe"
@@ -34,6 +69,31 @@ KEY_VALUE_LINE_RE = re.compile(r'^\s*(?P<key>[^:]+?)\s*:\s*(?P<value>.+?)\s*$')
 KEY_VALUE_WS_LINE_RE = re.compile(r'^\s*(?P<key>[^:\n]+?)(?:\t+| {2,})(?P<value>.+?)\s*$')
 
 
+# Header keyword matching: a cell "matches" when any FIELD_MAPPING alias occurs inside it
+# or the cell itself occurs inside an alias. Both directions are precomputed once - one
+# alternation regex for alias-in-cell, and the set of every alias substring for
+# cell-in-alias - so each cell costs a regex search and a set lookup instead of a
+# Python loop over all ~200 aliases.
+_HEADER_KEYWORDS = frozenset(kw.lower() for aliases in FIELD_MAPPING.values() for kw in aliases)
+_HEADER_KEYWORD_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_HEADER_KEYWORDS, key=len, reverse=True)))
+)
+_HEADER_KEYWORD_SUBSTRINGS = frozenset(
+    kw[i:j] for kw in _HEADER_KEYWORDS for i in range(len(kw) + 1) for j in range(i, len(kw) + 1)
+)
+
+
+def _matches_header_keyword(value: str) -> bool:
+    return value in _HEADER_KEYWORD_SUBSTRINGS or _HEADER_KEYWORD_RE.search(value) is not None
+
+
+@lru_cache(maxsize=4096)
+def _normalize_header_cell(value: str) -> str:
+    """Lowercase and remove accents for header-row scoring. Cached: candidate header
+    cells ("Nombre", "Correo", ...) repeat across rows, sections and files."""
+    return unicodedata.normalize('NFD', value.lower().strip()).translate(_COMBINING_MARKS)
+
+
 def _match_key_value_line(line: str):
     """Match a pasted 'label: value' or 'label<tab/2+ spaces>value' line.
 
@@ -57,6 +117,18 @@ def _match_key_value_line(line: str):
     return key, value
 
 
+def _excel_cell_value(cell):
+    """Cell value converted the way pd.read_excel's openpyxl reader does"""
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return float('nan')
+    if cell.data_type == TYPE_NUMERIC:
+        val = int(cell.value)
+        return val if val == cell.value else float(cell.value)
+    return cell.value
+
+
 class FileParser:
     """
     Parses various file formats into pandas DataFrames
@@ -64,19 +136,26 @@ class FileParser:
     """
 
     def detect_encoding(self, file_path: str) -> str:
-        """Detect file encoding, trying UTF-8 first"""
+        """Detect file encoding from the first ENCODING_SAMPLE_BYTES, trying UTF-8 first"""
+        with open(file_path, 'rb') as f:
+            head = f.read(ENCODING_SAMPLE_BYTES)
+
+        if head.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                f.read()
+            # Incremental decode so a multi-byte character cut at the sample boundary
+            # doesn't count as invalid UTF-8
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=len(head) < ENCODING_SAMPLE_BYTES)
             return 'utf-8'
         except UnicodeDecodeError:
             pass
 
-        # Fallback to chardet
-        with open(file_path, 'rb') as f:
-            rawdata = f.read(10000)
-        result = chardet.detect(rawdata)
-        encoding = result['encoding']
+        # Fallback to chardet on the same sample
+        detector = UniversalDetector()
+        detector.feed(head)
+        detector.close()
+        encoding = detector.result['encoding']
         logger.debug(f"Detected encoding: {encoding}")
         return encoding if encoding else 'utf-8'
 
@@ -88,24 +167,15 @@ class FileParser:
         max_matches = 0
         header_idx = 0
 
-        # Flatten mapping values for easy lookup
-        all_keywords = [kw.lower() for sublist in FIELD_MAPPING.values() for kw in sublist]
-
         # Check first 20 rows
-        for i in range(min(20, len(df))):
+        for i, row in enumerate(df.head(20).itertuples(index=False, name=None)):
             row_values = []
-            for val in df.iloc[i]:
+            for val in row:
                 if pd.notna(val):
-                    val_str = str(val).lower().strip()
-                    # Remove accents for better matching
-                    val_normalized = ''.join(
-                        c for c in unicodedata.normalize('NFD', val_str)
-                        if unicodedata.category(c) != 'Mn'
-                    )
-                    row_values.append(val_normalized)
+                    row_values.append(_normalize_header_cell(str(val)))
 
             # Count matches
-            matches = sum(1 for val in row_values if any(kw in val or val in kw for kw in all_keywords))
+            matches = sum(1 for val in row_values if _matches_header_keyword(val))
 
             if matches > max_matches:
                 max_matches = matches
@@ -163,7 +233,7 @@ class FileParser:
             _match_key_value_line(ln) or self._is_vertical_section_title(ln) for ln in lines
         ):
             return ['\n'.join(lines)]
-        sections = [s.strip() for s in re.split(r'\n\s*\n+', cleaned) if s.strip()]
+        sections = [s.strip() for s in _SECTION_BREAK_RE.split(cleaned) if s.strip()]
         return sections if sections else [cleaned]
 
     def _strip_labeled_value(self, line: str) -> str:
@@ -216,13 +286,11 @@ class FileParser:
         df_temp = pd.DataFrame(matrix_rows)
         header_idx = self.find_header_row(df_temp)
         header_score_row = df_temp.iloc[header_idx].tolist()
-        all_keywords = [kw.lower() for sublist in FIELD_MAPPING.values() for kw in sublist]
         matches = 0
         for val in header_score_row:
             if pd.isna(val):
                 continue
-            val_norm = _normalize_header_token(str(val))
-            if any(kw in val_norm or val_norm in kw for kw in all_keywords):
+            if _matches_header_keyword(_normalize_header_token(str(val))):
                 matches += 1
         return matches >= 2
 
@@ -239,7 +307,7 @@ class FileParser:
             value = match.group('value').strip()
             if value and (
                 '@' in value
-                or sum(c.isdigit() for c in value) >= 4
+                or _PHONE_LINE_RE.match(value)
                 or (len(value.split()) >= 2 and not any(
                     _normalize_header_token(value) in _alias_tokens(aliases)
                     for aliases in FIELD_MAPPING.values()
@@ -305,7 +373,7 @@ class FileParser:
                 val = data_lines[idx]
                 if '@' in val and ' ' not in val.strip():
                     break
-                if sum(c.isdigit() for c in val) >= 4 and not any(ch.isalpha() for ch in val.replace('-', '')):
+                if _PHONE_LINE_RE.match(val) and not any(ch.isalpha() for ch in val.replace('-', '')):
                     extra = data_lines[idx]
                     idx += 1
                     ext_col = next((i for i, h in enumerate(headers) if _normalize_header_token(h) == 'ext'), -1)
@@ -324,16 +392,12 @@ class FileParser:
         if df.empty:
             return False
         cols = [str(c).strip() for c in df.columns]
-        all_keywords = [kw.lower() for sublist in FIELD_MAPPING.values() for kw in sublist]
-        matches = sum(
-            1 for c in cols
-            if any(kw in _normalize_header_token(c) or _normalize_header_token(c) in kw for kw in all_keywords)
-        )
+        matches = sum(1 for c in cols if _matches_header_keyword(_normalize_header_token(c)))
         if matches >= 2:
             return True
-        if any(sum(ch.isdigit() for ch in str(c)) >= 7 and '@' not in str(c) for c in cols):
+        if any(_PHONE_LIKE_LABEL_RE.match(c) and '@' not in c for c in cols):
             return False
-        return any('@' in str(v) for _, row in df.iterrows() for v in row.tolist())
+        return any('@' in str(v) for row in df.itertuples(index=False, name=None) for v in row)
 
     def _row_echoes_header(self, headers: List[str], row: List[str]) -> bool:
         if not headers or not row:
@@ -408,42 +472,37 @@ class FileParser:
                     continue
                 clean_lines.append(s)
 
+            # Strip labels once and index the email anchors up front, so the scan
+            # jumps from anchor to anchor instead of re-testing every line
+            values = [self._strip_labeled_value(s) for s in clean_lines]
+            email_indices = [j for j, v in enumerate(values) if '@' in v and ' ' not in v]
+
             # Scan for emails and anchor around them
             i = 0
-            while i < len(clean_lines):
-                # Find next email
-                email_idx = -1
-                for j in range(i, min(i + 12, len(clean_lines))):
-                    if self._looks_like_email(clean_lines[j]):
-                        email_idx = j
-                        break
-
-                if email_idx == -1:
+            while i < len(values):
+                # Find next email (within the next 12 lines)
+                next_email = bisect_left(email_indices, i)
+                if next_email == len(email_indices) or email_indices[next_email] >= i + 12:
                     break  # No more emails
+                email_idx = email_indices[next_email]
 
                 # Extract fields relative to email
                 name = ""
                 title = ""
 
                 if email_idx >= 2:
-                    title = self._strip_labeled_value(clean_lines[email_idx - 1])
-                    name = self._strip_labeled_value(clean_lines[email_idx - 2])
+                    title = values[email_idx - 1]
+                    name = values[email_idx - 2]
                 elif email_idx == 1:
-                    name = self._strip_labeled_value(clean_lines[email_idx - 1])
+                    name = values[email_idx - 1]
 
-                email = self._strip_labeled_value(clean_lines[email_idx])
+                email = values[email_idx]
 
-                # Extract phones after email
+                # Extract phones after email (lines with at least 4 digits)
                 p_idx = email_idx + 1
-                raw_phones = []
-                while p_idx < len(clean_lines):
-                    val = self._strip_labeled_value(clean_lines[p_idx])
-                    digit_count = sum(c.isdigit() for c in val)
-                    if digit_count >= 4:
-                        raw_phones.append(val)
-                        p_idx += 1
-                    else:
-                        break
+                while p_idx < len(values) and _PHONE_LINE_RE.match(values[p_idx]):
+                    p_idx += 1
+                raw_phones = values[email_idx + 1:p_idx]
 
                 # Process phones
                 work_phone = ""
@@ -451,13 +510,13 @@ class FileParser:
                 work_phone_ext = ""
 
                 for p in raw_phones:
-                    digits = "".join(filter(str.isdigit, p))
+                    full_phone = _FULL_PHONE_RE.match(p)
 
-                    if len(digits) < 8:
+                    if not full_phone:
                         work_phone_ext = p
                     else:
                         # Heuristic: Mobile usually starts with 6, 7, 8 in Costa Rica
-                        if digits.startswith(('6', '7', '8')):
+                        if full_phone.group(1) in '678':
                             mobile_phone = p
                         else:
                             work_phone = p
@@ -481,6 +540,162 @@ class FileParser:
             logger.error(f"Error parsing vertical TXT: {e}")
             return pd.DataFrame()
 
+    def _text_column_dtypes(self, df_temp: pd.DataFrame, header_idx: int) -> Dict[int, type]:
+        """Read dtype forcing str on the columns whose header maps to a TEXT_FIELDS field"""
+        if df_temp.empty:
+            return {}
+        dtypes = {}
+        for pos, label in enumerate(df_temp.iloc[header_idx].tolist()):
+            if pd.isna(label):
+                continue
+            key = str(label).lower().strip()
+            hit = ALIAS_FIELD_MAP.get(key)
+            field = hit[0] if hit else (
+                CANONICAL_FIELD_MAP.get(_canonical_header_key(key)) or find_fuzzy_field_match(key)
+            )
+            if field in TEXT_FIELDS:
+                dtypes[pos] = str
+        return dtypes
+
+    def _iter_xlsx_rows(self, file_path: str) -> Iterator[list]:
+        """
+        Rows of the first worksheet, streamed from a read_only openpyxl pass with
+        trailing empty cells dropped. Empty rows are held back until a row with data
+        follows, so trailing empty rows are trimmed like pd.read_excel does.
+        """
+        workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet = workbook.worksheets[0]
+            sheet.reset_dimensions()
+            empty_rows = 0
+            for row in sheet.rows:
+                values = [_excel_cell_value(cell) for cell in row]
+                while values and values[-1] == "":
+                    values.pop()
+                if not values:
+                    empty_rows += 1
+                    continue
+                for _ in range(empty_rows):
+                    yield []
+                empty_rows = 0
+                yield values
+        finally:
+            workbook.close()
+
+    def _read_excel(self, file_path: str) -> pd.DataFrame:
+        """Two-pass pd.read_excel path for .xls (and .xlsx the single pass can't read)"""
+        # Try openpyxl first, fallback to xlrd
+        try:
+            df_temp = pd.read_excel(file_path, engine='openpyxl', header=None)
+        except Exception:
+            df_temp = pd.read_excel(file_path, engine='xlrd', header=None)
+
+        # Find header row
+        header_idx = self.find_header_row(df_temp)
+        logger.debug(f"Reading Excel with header at row {header_idx}")
+        dtype = self._text_column_dtypes(df_temp, header_idx)
+
+        # Re-read with correct header
+        try:
+            return pd.read_excel(file_path, engine='openpyxl', header=header_idx, dtype=dtype)
+        except Exception:
+            return pd.read_excel(file_path, engine='xlrd', header=header_idx, dtype=dtype)
+
+    def _xlsx_frames_or_none(self, file_path: str, chunksize: Optional[int] = None) -> Optional[Iterator[pd.DataFrame]]:
+        """
+        DataFrame(s) of a .xlsx in one openpyxl pass: a single frame, or chunks of at
+        most chunksize rows built as the sheet is read. The header is located up
+        front; if the workbook can't be read that far, returns None (logged) so
+        callers fall back to pd.read_excel.
+        """
+        rows = self._iter_xlsx_rows(file_path)
+        try:
+            # Header scoring only looks at the first 20 rows
+            head = list(islice(rows, 20))
+            if not head:
+                return iter(())
+            df_temp = self._xlsx_frame(head, header=None)
+            header_idx = self.find_header_row(df_temp)
+            dtype = self._text_column_dtypes(df_temp, header_idx)
+        except Exception as e:
+            rows.close()
+            logger.warning(f"Single-pass Excel read failed ({e}); falling back to pd.read_excel")
+            return None
+
+        logger.debug(f"Reading Excel with header at row {header_idx}")
+        return self._iter_xlsx_frames(head[header_idx], chain(head[header_idx + 1:], rows), dtype, chunksize)
+
+    def _iter_xlsx_frames(self, header: list, rows: Iterator[list], dtype: Dict[int, type],
+                          chunksize: Optional[int]) -> Iterator[pd.DataFrame]:
+        """Frames for the data rows after the header: one, or chunks of at most chunksize rows"""
+        if chunksize is None:
+            yield self._xlsx_frame([header, *rows], header=0, dtype=dtype)
+            return
+        while True:
+            chunk = list(islice(rows, chunksize))
+            if not chunk:
+                return
+            df = self._xlsx_frame([header, *chunk], header=0, dtype=dtype)
+            if not df.empty:
+                yield df
+
+    def _xlsx_frame(self, rows: List[list], header: Optional[int], dtype: Optional[Dict[int, type]] = None) -> pd.DataFrame:
+        """
+        Rows padded to a common width and converted with TextParser, the reader
+        pd.read_excel itself uses, so cell types and NA handling match it
+        """
+        width = max(len(row) for row in rows)
+        padded = [row + [""] * (width - len(row)) for row in rows]
+        return TextParser(padded, header=header, dtype=dtype, skip_blank_lines=False).read()
+
+    def _find_delimited_header(self, file_path: str, encoding: str, delimiter: str = ','):
+        """Header row index and read dtype for a delimited file"""
+        df_temp = self._read_raw_matrix(file_path, encoding, delimiter=delimiter)
+        header_idx = self.find_header_row(df_temp)
+        logger.debug(f"Reading delimited file ({delimiter!r}) with header at row {header_idx}")
+        return header_idx, self._text_column_dtypes(df_temp, header_idx)
+
+    def iter_chunks(self, file_path: str, chunksize: int = PARSE_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Parse file as a sequence of non-empty DataFrames.
+        CSV and .xlsx are streamed in chunks of at most chunksize rows so the whole
+        file is never held in memory; other formats are parsed whole and yielded once.
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        frames = self._xlsx_frames_or_none(file_path, chunksize) if ext == '.xlsx' else None
+        if frames is not None:
+            total = 0
+            for chunk in frames:
+                total += len(chunk)
+                yield chunk
+            logger.info(f"✅ Parsed {total} rows from {os.path.basename(file_path)}")
+            return
+
+        if ext != '.csv':
+            df = self.parse_file(file_path)
+            if not df.empty:
+                yield df
+            return
+
+        try:
+            encoding = self.detect_encoding(file_path)
+            header_idx, dtype = self._find_delimited_header(file_path, encoding)
+            reader = pd.read_csv(
+                file_path, encoding=encoding, header=header_idx, dtype=dtype, chunksize=chunksize
+            )
+        except Exception as e:
+            logger.error(f"Error parsing file: {e}")
+            return
+
+        rows = 0
+        with reader:
+            for chunk in reader:
+                if chunk.empty:
+                    continue
+                rows += len(chunk)
+                yield chunk
+        logger.info(f"✅ Parsed {rows} rows from {os.path.basename(file_path)}")
+
     def parse_file(self, file_path: str) -> pd.DataFrame:
         """
         Parse file based on extension
@@ -495,27 +710,17 @@ class FileParser:
                 # exports routinely have a title/preamble row (e.g. "BASE DE DATOS") or
                 # blank rows before the actual column headers, which would otherwise be
                 # misread as the header itself.
-                df_temp = self._read_raw_matrix(file_path, encoding, delimiter=',')
-                header_idx = self.find_header_row(df_temp)
-                logger.debug(f"Reading CSV with header at row {header_idx}")
-                df = pd.read_csv(file_path, encoding=encoding, header=header_idx)
+                header_idx, dtype = self._find_delimited_header(file_path, encoding)
+                df = pd.read_csv(file_path, encoding=encoding, header=header_idx, dtype=dtype)
 
             elif ext in ['.xls', '.xlsx']:
-                # Try openpyxl first, fallback to xlrd
-                try:
-                    df_temp = pd.read_excel(file_path, engine='openpyxl', header=None)
-                except Exception:
-                    df_temp = pd.read_excel(file_path, engine='xlrd', header=None)
-
-                # Find header row
-                header_idx = self.find_header_row(df_temp)
-                logger.debug(f"Reading Excel with header at row {header_idx}")
-
-                # Re-read with correct header
-                try:
-                    df = pd.read_excel(file_path, engine='openpyxl', header=header_idx)
-                except Exception:
-                    df = pd.read_excel(file_path, engine='xlrd', header=header_idx)
+                # .xlsx is read in one openpyxl pass; .xls (or a failed pass) goes
+                # through pd.read_excel
+                xlsx_frames = self._xlsx_frames_or_none(file_path) if ext == '.xlsx' else None
+                if xlsx_frames is not None:
+                    df = next(xlsx_frames, pd.DataFrame())
+                else:
+                    df = self._read_excel(file_path)
 
             elif ext in ['.txt', '.md']:
                 with open(file_path, 'r', encoding=encoding, errors='replace') as f:
@@ -538,16 +743,24 @@ class FileParser:
                             df = stacked
                     if df.empty:
                         delimiter = self._detect_delimiter(file_path, encoding)
-                        df_temp = self._read_raw_matrix(file_path, encoding, delimiter=delimiter)
-                        header_idx = self.find_header_row(df_temp)
-                        logger.debug(f"Reading TXT with delimiter {delimiter!r}, header at row {header_idx}")
+                        header_idx, dtype = self._find_delimited_header(file_path, encoding, delimiter)
+                        # _detect_delimiter only returns single characters, which the
+                        # C tokenizer handles; no need for the slower python engine
                         df = pd.read_csv(
-                            file_path, encoding=encoding, sep=delimiter, header=header_idx, engine='python'
+                            file_path, encoding=encoding, sep=delimiter, header=header_idx, dtype=dtype
                         )
 
             elif ext == '.json':
-                with open(file_path, 'r', encoding=encoding) as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                # orjson parses UTF-8 bytes directly; other encodings are decoded first
+                if encoding != 'utf-8':
+                    raw = raw.decode(encoding)
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # NaN/Infinity literals and >64-bit integers are stdlib-only
+                    data = json.loads(raw)
                 df = pd.DataFrame(data)
 
             else:
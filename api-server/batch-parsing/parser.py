@@ -5,33 +5,42 @@ Entry point for parsing batch files and storing to PostgreSQL + Cassandra hybrid
 """
 
 import os
+import re
 import sys
 import json
 import uuid
 import argparse
 import logging
-import traceback
+import multiprocessing
 import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 
 import pandas as pd
-import psycopg2
+from psycopg2.extras import execute_values, register_uuid
+from psycopg2.pool import ThreadedConnectionPool
 from cassandra.cluster import Cluster
+from cassandra.concurrent import execute_concurrent_with_args
 from cassandra import ConsistencyLevel
 from cassandra.query import SimpleStatement
+from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
 
 # Import parsing logic (will be in same directory)
 from data_normalizer import (
     DataNormalizer,
     FIELD_MAPPING,
+    ALIAS_FIELD_MAP,
     CANONICAL_FIELD_MAP,
     find_fuzzy_field_match,
     _canonical_header_key,
 )
 from file_parser import FileParser
-from storage_client import StorageClient
+from storage_client import get_storage_client
 
 # Setup logging
 logging.basicConfig(
@@ -41,219 +50,231 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class BatchParser:
-    """
-    Main batch parsing service that coordinates:
-    1. File parsing
-    2. Data normalization
-    3. Hybrid database writes (PostgreSQL + Cassandra)
-    """
-
-    def __init__(
-        self,
-        batch_id: str,
-        file_path: str,
-        postgres_url: str,
-        cassandra_hosts: List[str],
-        cassandra_keyspace: str = 'ecards',
-        storage_mode: str = 'seaweedfs',
-        work_phone_prefix: Optional[str] = None,
-        default_country_code: Optional[str] = None,
-        max_records: Optional[int] = None
-    ):
-        self.batch_id = batch_id
-        self.file_path = file_path
-        self.postgres_url = postgres_url
-        self.cassandra_hosts = cassandra_hosts
-        self.cassandra_keyspace = cassandra_keyspace
-        self.work_phone_prefix = work_phone_prefix
-        self.default_country_code = default_country_code
-        self.max_records = max_records
-
-        # Initialize components
-        self.normalizer = DataNormalizer()
-        self.file_parser = FileParser()
-        self.storage_client = StorageClient(storage_mode)
+# Let psycopg2 adapt uuid.UUID parameters, so record ids aren't stringified per row
+register_uuid()
 
-        # Database connections (initialized later)
-        self.pg_conn = None
-        self.cassandra_session = None
+# Mapped records are written in flushes of this size: one multi-row
+# PostgreSQL INSERT plus pipelined Cassandra writes, instead of two round-trips per row
+INSERT_BATCH_SIZE = 1000
 
-    def connect_databases(self):
-        """Establish connections to PostgreSQL and Cassandra"""
-        try:
-            # Connect to PostgreSQL
-            logger.info(f"Connecting to PostgreSQL...")
-            self.pg_conn = psycopg2.connect(self.postgres_url)
-            logger.info("✅ PostgreSQL connected")
-
-            # Connect to Cassandra
-            logger.info(f"Connecting to Cassandra cluster: {self.cassandra_hosts}")
-            cluster = Cluster(
-                contact_points=self.cassandra_hosts,
-                connect_timeout=30
-            )
-            self.cassandra_session = cluster.connect(self.cassandra_keyspace)
-            logger.info(f"✅ Cassandra connected to keyspace: {self.cassandra_keyspace}")
-
-            # Prepare the INSERT statement for contact_records
-            insert_cql = """
-                INSERT INTO contact_records (
-                    batch_record_id, batch_id, created_at, updated_at,
-                    full_name, first_name, last_name,
-                    work_phone, work_phone_ext, mobile_phone, email,
-                    address_street, address_city, address_state, address_postal, address_country,
-                    social_instagram, social_twitter, social_facebook,
-                    business_name, business_title, business_department, business_url, business_hours,
-                    business_address_street, business_address_city, business_address_state,
-                    business_address_postal, business_address_country,
-                    business_linkedin, business_twitter,
-                    personal_url, personal_bio, personal_birthday,
-                    extra
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            self.cassandra_prepared_stmt = self.cassandra_session.prepare(insert_cql)
-            logger.info("✅ Cassandra prepared statement created")
-
-        except Exception as e:
-            logger.error(f"❌ Database connection failed: {e}")
-            raise
-
-    def update_batch_status(self, status: str, error_message: Optional[str] = None,
-                           records_count: Optional[int] = None,
-                           records_processed: Optional[int] = None):
-        """Update batch status in PostgreSQL"""
-        try:
-            cursor = self.pg_conn.cursor()
+# Max in-flight Cassandra INSERTs per flush
+CASSANDRA_INSERT_CONCURRENCY = 100
 
-            if status == 'PARSING':
-                stmt = """
-                    UPDATE batches
-                    SET status = %s, parsing_started_at = %s, updated_at = %s
-                    WHERE id = %s
-                """
-                values = (status, datetime.now(), datetime.now(), self.batch_id)
-
-                logger.info("=" * 80)
-                logger.info("EXECUTING: UPDATE PARSING")
-                logger.info(f"Statement placeholders: {stmt.count('%s')}")
-                logger.info(f"Values count: {len(values)}")
-                logger.info(f"Values: {values}")
-                logger.info("=" * 80)
+# Pinned so the driver doesn't spend connects negotiating the protocol down
+CASSANDRA_PROTOCOL_VERSION = 4
+CASSANDRA_EXECUTOR_THREADS = 8
 
-                try:
-                    cursor.execute(stmt, values)
-                    logger.info("✅ UPDATE PARSING executed successfully")
-                except Exception as e:
-                    logger.error(f"❌ UPDATE PARSING failed!")
-                    logger.error(f"Error type: {type(e).__name__}")
-                    logger.error(f"Error message: {str(e)}")
-                    logger.error(f"Traceback:\n{traceback.format_exc()}")
-                    raise
-
-            elif status == 'PARSED':
-                stmt = """
-                    UPDATE batches
-                    SET status = %s,
-                        records_count = %s,
-                        records_processed = %s,
-                        parsing_completed_at = %s,
-                        processed_at = %s,
-                        updated_at = %s
-                    WHERE id = %s
-                """
-                values = (status, records_count, records_processed, datetime.now(),
-                          datetime.now(), datetime.now(), self.batch_id)
-
-                logger.info("=" * 80)
-                logger.info("EXECUTING: UPDATE PARSED")
-                logger.info(f"Statement placeholders: {stmt.count('%s')}")
-                logger.info(f"Values count: {len(values)}")
-                logger.info(f"Values: {values}")
-                logger.info("=" * 80)
+PG_INSERT_RECORDS_SQL = """
+    INSERT INTO batch_records
+    (id, batch_id, full_name, work_phone, mobile_phone, email, business_name, created_at, updated_at)
+    VALUES %s
+"""
 
-                try:
-                    cursor.execute(stmt, values)
-                    logger.info("✅ UPDATE PARSED executed successfully")
-                except Exception as e:
-                    logger.error(f"❌ UPDATE PARSED failed!")
-                    logger.error(f"Error type: {type(e).__name__}")
-                    logger.error(f"Error message: {str(e)}")
-                    logger.error(f"Traceback:\n{traceback.format_exc()}")
-                    raise
+CASSANDRA_INSERT_CQL = """
+    INSERT INTO contact_records (
+        batch_record_id, batch_id, created_at, updated_at,
+        full_name, first_name, last_name,
+        work_phone, work_phone_ext, mobile_phone, email,
+        address_street, address_city, address_state, address_postal, address_country,
+        social_instagram, social_twitter, social_facebook,
+        business_name, business_title, business_department, business_url, business_hours,
+        business_address_street, business_address_city, business_address_state,
+        business_address_postal, business_address_country,
+        business_linkedin, business_twitter,
+        personal_url, personal_bio, personal_birthday,
+        extra
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-            elif status == 'LOADED':
-                stmt = """
-                    UPDATE batches
-                    SET status = %s,
-                        records_count = %s,
-                        records_processed = %s,
-                        updated_at = %s
-                    WHERE id = %s
-                """
-                values = (status, records_count, records_processed, datetime.now(), self.batch_id)
-
-                logger.info("=" * 80)
-                logger.info("EXECUTING: UPDATE LOADED")
-                logger.info(f"Statement placeholders: {stmt.count('%s')}")
-                logger.info(f"Values count: {len(values)}")
-                logger.info(f"Values: {values}")
-                logger.info("=" * 80)
+# Undo a failed parse's committed flushes: ids are read back with a server-side
+# cursor so a large batch isn't loaded into memory at once
+PG_SELECT_BATCH_RECORD_IDS_SQL = "SELECT id FROM batch_records WHERE batch_id = %s"
+PG_DELETE_BATCH_RECORDS_SQL = "DELETE FROM batch_records WHERE batch_id = %s"
+CASSANDRA_DELETE_CQL = "DELETE FROM contact_records WHERE batch_record_id = ?"
 
-                try:
-                    cursor.execute(stmt, values)
-                    logger.info("✅ UPDATE LOADED executed successfully")
-                except Exception as e:
-                    logger.error(f"❌ UPDATE LOADED failed!")
-                    logger.error(f"Error type: {type(e).__name__}")
-                    logger.error(f"Error message: {str(e)}")
-                    logger.error(f"Traceback:\n{traceback.format_exc()}")
-                    raise
+# Files with at least this many rows (per parsed chunk) are mapped in parallel
+# worker processes; smaller ones don't pay the process/pickling overhead
+PARALLEL_MAP_MIN_ROWS = 10_000
+MAX_MAP_WORKERS = 8
 
-            elif status == 'ERROR':
-                stmt = """
-                    UPDATE batches
-                    SET status = %s, error_message = %s, updated_at = %s
-                    WHERE id = %s
-                """
-                values = (status, error_message, datetime.now(), self.batch_id)
-
-                logger.info("=" * 80)
-                logger.info("EXECUTING: UPDATE ERROR")
-                logger.info(f"Statement placeholders: {stmt.count('%s')}")
-                logger.info(f"Values count: {len(values)}")
-                logger.info(f"Values: {values}")
-                logger.info("=" * 80)
+# Trailing ".0" left on whole numbers by float columns (Excel/CSV inference)
+_TRAILING_DOT_ZERO_RE = re.compile(r'\.0$')
 
-                try:
-                    cursor.execute(stmt, values)
-                    logger.info("✅ UPDATE ERROR executed successfully")
-                except Exception as e:
-                    logger.error(f"❌ UPDATE ERROR failed!")
-                    logger.error(f"Error type: {type(e).__name__}")
-                    logger.error(f"Error message: {str(e)}")
-                    logger.error(f"Traceback:\n{traceback.format_exc()}")
-                    raise
-
-            self.pg_conn.commit()
-            logger.info(f"✅ Batch status updated to: {status}")
+# Record fields in column order for the batch_records / contact_records INSERTs,
+# extracted with one itemgetter call per row (mapped records carry every field)
+PG_RECORD_KEYS = (
+    'full_name', 'work_phone', 'mobile_phone', 'email', 'business_name',
+)
+CASSANDRA_RECORD_KEYS = (
+    'full_name', 'first_name', 'last_name', 'work_phone', 'work_phone_ext',
+    'mobile_phone', 'email', 'address_street', 'address_city', 'address_state',
+    'address_postal', 'address_country', 'social_instagram', 'social_twitter',
+    'social_facebook', 'business_name', 'business_title', 'business_department',
+    'business_url', 'business_hours', 'business_address_street',
+    'business_address_city', 'business_address_state', 'business_address_postal',
+    'business_address_country', 'business_linkedin', 'business_twitter',
+    'personal_url', 'personal_bio', 'personal_birthday',
+)
+_PG_RECORD_FIELDS = itemgetter(*PG_RECORD_KEYS)
+_CASSANDRA_RECORD_FIELDS = itemgetter(*CASSANDRA_RECORD_KEYS)
+
+# Batch status transitions, one UPDATE per status. Named placeholders so every
+# statement is executed with the same parameter dict.
+BATCH_STATUS_UPDATES = {
+    'PARSING': """
+        UPDATE batches
+        SET status = %(status)s, parsing_started_at = %(now)s, updated_at = %(now)s
+        WHERE id = %(batch_id)s
+    """,
+    'PARSED': """
+        UPDATE batches
+        SET status = %(status)s,
+            records_count = %(records_count)s,
+            records_processed = %(records_processed)s,
+            parsing_completed_at = %(now)s,
+            processed_at = %(now)s,
+            updated_at = %(now)s
+        WHERE id = %(batch_id)s
+    """,
+    'LOADED': """
+        UPDATE batches
+        SET status = %(status)s,
+            records_count = %(records_count)s,
+            records_processed = %(records_processed)s,
+            updated_at = %(now)s
+        WHERE id = %(batch_id)s
+    """,
+    'ERROR': """
+        UPDATE batches
+        SET status = %(status)s, error_message = %(error_message)s, updated_at = %(now)s
+        WHERE id = %(batch_id)s
+    """,
+}
+
+# PostgreSQL pools and Cassandra sessions are created once per process and shared
+# by every BatchParser, so a long-lived worker pays the connect/metadata handshake
+# only for its first batch
+PG_POOL_MAX_CONNECTIONS = 4
+_pg_pools: Dict[str, ThreadedConnectionPool] = {}
+_cassandra_sessions: Dict[Tuple[Tuple[str, ...], str], Tuple[Any, Any]] = {}
+# Worker processes for mapping large files, likewise started once and reused
+_map_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pg_pool(postgres_url: str) -> ThreadedConnectionPool:
+    """Shared PostgreSQL connection pool for postgres_url"""
+    pool = _pg_pools.get(postgres_url)
+    if pool is None:
+        pool = _pg_pools[postgres_url] = ThreadedConnectionPool(1, PG_POOL_MAX_CONNECTIONS, postgres_url)
+    return pool
+
+
+def get_cassandra_session(hosts: List[str], keyspace: str) -> Tuple[Any, Any]:
+    """Shared Cassandra session and its prepared contact_records INSERT for hosts/keyspace"""
+    key = (tuple(hosts), keyspace)
+    if key not in _cassandra_sessions:
+        # Token-aware routing sends each prepared INSERT straight to a replica that
+        # owns its partition instead of through an arbitrary coordinator
+        cluster = Cluster(
+            contact_points=list(hosts),
+            connect_timeout=30,
+            load_balancing_policy=TokenAwarePolicy(DCAwareRoundRobinPolicy()),
+            protocol_version=CASSANDRA_PROTOCOL_VERSION,
+            executor_threads=CASSANDRA_EXECUTOR_THREADS,
+        )
+        session = cluster.connect(keyspace)
+        session.default_timeout = 30
+        session.default_consistency_level = ConsistencyLevel.LOCAL_ONE
+        _cassandra_sessions[key] = (session, session.prepare(CASSANDRA_INSERT_CQL))
+    return _cassandra_sessions[key]
+
+
+def get_map_pool() -> ProcessPoolExecutor:
+    """Shared worker pool for BatchParser.map_dataframe, started on first use"""
+    global _map_pool
+    if _map_pool is None:
+        # spawn, not fork: by now the Cassandra driver and boto3 have threads whose
+        # locks a forked child could inherit held
+        _map_pool = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, MAX_MAP_WORKERS),
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _map_pool
+
+
+def close_shared_connections():
+    """Close every pooled PostgreSQL connection, shut down the Cassandra clusters and the map pool"""
+    global _map_pool
+    for pool in _pg_pools.values():
+        pool.closeall()
+    _pg_pools.clear()
+    for session, _ in _cassandra_sessions.values():
+        session.cluster.shutdown()
+    _cassandra_sessions.clear()
+    if _map_pool is not None:
+        _map_pool.shutdown()
+        _map_pool = None
+
+
+@lru_cache(maxsize=256)
+def _resolve_headers(columns: tuple) -> Tuple[Dict[str, List[int]], List[Tuple[int, Optional[str], Optional[str]]]]:
+    """
+    Resolve a file's headers to vCard fields once, for map_row and map_dataframe.
+    Returns per-field exact-alias column positions (in FIELD_MAPPING alias order) and,
+    for every header in order, its (position, canonical target, fuzzy target).
+    Duplicate header keys keep their first position in the order but read the last
+    column with that key.
+    """
+    header_positions = {str(col).lower().strip(): pos for pos, col in enumerate(columns)}
+
+    alias_hits: Dict[str, List] = {}
+    headers = []
+    for header_key, pos in header_positions.items():
+        hit = ALIAS_FIELD_MAP.get(header_key)
+        if hit:
+            alias_hits.setdefault(hit[0], []).append((hit[1], pos))
+        canonical = _canonical_header_key(header_key)
+        headers.append((
+            pos,
+            CANONICAL_FIELD_MAP.get(canonical) if canonical else None,
+            find_fuzzy_field_match(header_key),
+        ))
+
+    exact = {field: [pos for _, pos in sorted(hits)] for field, hits in alias_hits.items()}
+    return exact, headers
+
+
+class RecordMapper:
+    """
+    Maps parsed rows to vCard fields: header resolution, cleaning/formatting,
+    name splitting and phone normalization. Holds no connections, so it can be
+    sent to worker processes.
+    """
 
-        except Exception as e:
-            logger.error(f"❌ Failed to update batch status: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
-            self.pg_conn.rollback()
-            raise
+    def __init__(
+        self,
+        normalizer: DataNormalizer,
+        work_phone_prefix: Optional[str] = None,
+        default_country_code: Optional[str] = None
+    ):
+        self.normalizer = normalizer
+        self.work_phone_prefix = work_phone_prefix
+        self.default_country_code = default_country_code
 
-    def map_row(self, row: pd.Series) -> Dict[str, Any]:
+    def map_row(self, row: Union[pd.Series, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Map a row from parsed file to vCard fields
         Based on FIELD_MAPPING from __script_v9.py
+        Accepts a pd.Series or a plain {header: value} dict (e.g. built from itertuples)
         """
-        mapped = {}
-
-        # Normalize row keys
-        row_keys = {str(k).lower().strip(): k for k in row.index}
-        matched_keys = set()
+        if isinstance(row, pd.Series):
+            exact, headers = _resolve_headers(tuple(row.index))
+            values = row.tolist()
+        else:
+            exact, headers = _resolve_headers(tuple(row))
+            values = list(row.values())
+        mapped = dict.fromkeys(FIELD_MAPPING)
+        matched_positions = set()
 
         def _assign(target_field: str, val) -> bool:
             """Clean + format a raw cell value and store it under target_field.
@@ -274,45 +295,31 @@ class BatchParser:
                 mapped[target_field] = self.normalizer.format_field(target_field, val_str)
             return True
 
-        # Pass 1: map fields based on FIELD_MAPPING's exact aliases
-        for target_field, aliases in FIELD_MAPPING.items():
-            found = False
-            for alias in aliases:
-                alias_lower = alias.lower()
-                if alias_lower in row_keys:
-                    if _assign(target_field, row[row_keys[alias_lower]]):
-                        matched_keys.add(alias_lower)
-                        found = True
-                        break
-                    matched_keys.add(alias_lower)
-            if not found:
-                mapped[target_field] = None
+        # Pass 1: map fields based on FIELD_MAPPING's exact aliases; per field,
+        # candidates are tried in FIELD_MAPPING alias order. Candidates after the
+        # first non-blank one stay available to the later passes.
+        for target_field, positions in exact.items():
+            for pos in positions:
+                matched_positions.add(pos)
+                if _assign(target_field, values[pos]):
+                    break
 
         # Pass 1b: canonical separator-insensitive matching — treats `_` and spaces as
         # interchangeable and ignores case, so a header like "Business Address Street"
         # (or BUSINESS_ADDRESS_STREET / business address street) resolves to
         # business_address_street. Additive: never overwrites a field an exact alias
         # already claimed.
-        for header_key, original_key in row_keys.items():
-            if header_key in matched_keys:
-                continue
-            canonical = _canonical_header_key(header_key)
-            if not canonical:
-                continue
-            target_field = CANONICAL_FIELD_MAP.get(canonical)
-            if target_field and not mapped.get(target_field):
-                if _assign(target_field, row[original_key]):
-                    matched_keys.add(header_key)
+        for pos, target_field, _ in headers:
+            if target_field and pos not in matched_positions and not mapped[target_field]:
+                if _assign(target_field, values[pos]):
+                    matched_positions.add(pos)
 
         # Pass 2: fuzzy fallback for headers that didn't exactly match any alias
         # (label mismatches like "Teléfono Oficina 2", "Cel./WhatsApp"). Never
         # overwrites a field a real alias already claimed.
-        for header_key, original_key in row_keys.items():
-            if header_key in matched_keys:
-                continue
-            fuzzy_field = find_fuzzy_field_match(header_key)
-            if fuzzy_field and not mapped.get(fuzzy_field):
-                _assign(fuzzy_field, row[original_key])
+        for pos, _, target_field in headers:
+            if target_field and pos not in matched_positions and not mapped[target_field]:
+                _assign(target_field, values[pos])
 
         # Special handling: Name splitting
         if mapped.get("first_name") and not mapped.get("last_name"):
@@ -323,6 +330,11 @@ class BatchParser:
                 mapped["last_name"] = parsed_name["last_name"]
                 mapped["full_name"] = parsed_name["full_name"]
 
+        self._finalize_phones(mapped)
+        return mapped
+
+    def _finalize_phones(self, mapped: Dict[str, Any]):
+        """Reconcile, apply the work-phone prefix policy and normalize phones in place"""
         # Some sheets have "Teléfono"/"Ext" values swapped even though both headers
         # matched correctly (a full number under "Ext", a short extension under
         # "Teléfono") — reclassify by value shape before normalizing/formatting phones.
@@ -345,124 +357,306 @@ class BatchParser:
                 default_country_code=self.default_country_code
             )
 
-        return mapped
+    def map_dataframe(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Map every row of a parsed file to vCard fields, column by column.
+        Produces the same records as calling map_row on each row, but headers are
+        resolved once and cleaning/formatting runs on whole columns.
+        """
+        df = df.reset_index(drop=True)
+        exact, headers = _resolve_headers(tuple(df.columns))
+        cleaned: Dict[int, pd.Series] = {}
+
+        def _column(pos: int) -> pd.Series:
+            # Same rules as map_row's _assign: NaN, "", "0" are blank; drop trailing .0
+            if pos not in cleaned:
+                raw = df.iloc[:, pos]
+                text = raw.astype(str).str.strip().str.replace(_TRAILING_DOT_ZERO_RE, '', regex=True)
+                cleaned[pos] = text.mask(raw.isna() | text.isin(("", "0")))
+            return cleaned[pos]
+
+        no_rows = pd.Series(False, index=df.index)
+        values: Dict[str, pd.Series] = {}
+        # Rows where a header has not been consumed yet (map_row's matched_positions, inverted)
+        eligible: Dict[int, pd.Series] = {}
+
+        # Pass 1: exact aliases, first non-blank candidate wins. Candidates after the
+        # winning one stay eligible for the later passes.
+        for target_field in FIELD_MAPPING:
+            value = pd.Series(None, index=df.index, dtype=object)
+            for pos in exact.get(target_field, ()):
+                eligible[pos] = value.notna()
+                value = value.fillna(_column(pos))
+            values[target_field] = value
+
+        # Pass 1b (canonical) then pass 2 (fuzzy): fill only still-empty fields
+        for target_index in (1, 2):
+            for header in headers:
+                pos, target_field = header[0], header[target_index]
+                if not target_field:
+                    continue
+                value = values[target_field]
+                fill = eligible.get(pos, ~no_rows) & value.isna() & _column(pos).notna()
+                if fill.any():
+                    value = value.copy()
+                    value[fill] = _column(pos)[fill]
+                    values[target_field] = value
+                    eligible[pos] = eligible.get(pos, ~no_rows) & ~fill
+
+        # Don't format name fields yet - parse_name needs original casing
+        for target_field, value in values.items():
+            if target_field in ("first_name", "last_name", "full_name"):
+                continue
+            present = value.notna()
+            if present.any():
+                value = value.copy()
+                value[present] = self.normalizer.format_column(target_field, value[present])
+                values[target_field] = value
+
+        # Special handling: Name splitting, only for rows with a single full-name cell
+        first_name, last_name = values["first_name"], values["last_name"]
+        split = first_name.notna() & last_name.isna() & first_name.str.contains(" ", regex=False, na=False)
+        if split.any():
+            parsed = self.normalizer.parse_names(first_name[split])
+            for name_field in ("first_name", "last_name", "full_name"):
+                value = values[name_field].copy()
+                value[split] = parsed[name_field]
+                values[name_field] = value
+
+        frame = pd.DataFrame(values, index=df.index)
+        records = frame.astype(object).where(frame.notna(), None).to_dict(orient='records')
+        for mapped in records:
+            self._finalize_phones(mapped)
+        return records
+
+
+def _map_slice(mapper: RecordMapper, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Worker-process entry point for BatchParser.map_dataframe"""
+    return mapper.map_dataframe(df)
+
+
+class BatchParser:
+    """
+    Main batch parsing service that coordinates:
+    1. File parsing
+    2. Data normalization
+    3. Hybrid database writes (PostgreSQL + Cassandra)
+    """
+
+    def __init__(
+        self,
+        batch_id: str,
+        file_path: str,
+        postgres_url: str,
+        cassandra_hosts: List[str],
+        cassandra_keyspace: str = 'ecards',
+        storage_mode: str = 'seaweedfs',
+        work_phone_prefix: Optional[str] = None,
+        default_country_code: Optional[str] = None,
+        max_records: Optional[int] = None
+    ):
+        self.batch_id = batch_id
+        self.batch_uuid = uuid.UUID(batch_id)
+        self.file_path = file_path
+        self.postgres_url = postgres_url
+        self.cassandra_hosts = cassandra_hosts
+        self.cassandra_keyspace = cassandra_keyspace
+        self.work_phone_prefix = work_phone_prefix
+        self.default_country_code = default_country_code
+        self.max_records = max_records
+
+        # Initialize components
+        self.normalizer = DataNormalizer()
+        self.mapper = RecordMapper(self.normalizer, work_phone_prefix, default_country_code)
+        self.file_parser = FileParser()
+        self.storage_client = get_storage_client(storage_mode)
+
+        # Database connections (initialized later)
+        self.pg_conn = None
+        self.cassandra_session = None
+
+    def connect_databases(self):
+        """Establish connections to PostgreSQL and Cassandra"""
+        try:
+            # Connect to PostgreSQL
+            logger.info(f"Connecting to PostgreSQL...")
+            self.pg_conn = get_pg_pool(self.postgres_url).getconn()
+            logger.info("✅ PostgreSQL connected")
+
+            # Connect to Cassandra
+            logger.info(f"Connecting to Cassandra cluster: {self.cassandra_hosts}")
+            self.cassandra_session, self.cassandra_prepared_stmt = get_cassandra_session(
+                self.cassandra_hosts, self.cassandra_keyspace
+            )
+            logger.info(f"✅ Cassandra connected to keyspace: {self.cassandra_keyspace}")
 
-    def insert_record(self, record: Dict[str, Any]) -> str:
+        except Exception as e:
+            logger.error(f"❌ Database connection failed: {e}")
+            raise
+
+    def update_batch_status(self, status: str, error_message: Optional[str] = None,
+                           records_count: Optional[int] = None,
+                           records_processed: Optional[int] = None):
+        """Update batch status in PostgreSQL"""
+        stmt = BATCH_STATUS_UPDATES.get(status)
+        if stmt is None:
+            logger.warning("Unknown batch status %r; not updating", status)
+            return
+
+        params = {
+            'status': status,
+            'error_message': error_message,
+            'records_count': records_count,
+            'records_processed': records_processed,
+            'now': datetime.now(),
+            'batch_id': self.batch_id,
+        }
+
+        try:
+            cursor = self.pg_conn.cursor()
+            logger.debug("Executing batch status update %s with %s", status, params)
+            cursor.execute(stmt, params)
+            self.pg_conn.commit()
+            logger.info("✅ Batch status updated to: %s", status)
+
+        except Exception as e:
+            logger.exception("❌ Failed to update batch status to %s: %s", status, e)
+            self.pg_conn.rollback()
+            raise
+
+    def map_row(self, row: Union[pd.Series, Dict[str, Any]]) -> Dict[str, Any]:
+        """Map a row from parsed file to vCard fields (see RecordMapper.map_row)"""
+        return self.mapper.map_row(row)
+
+    def map_dataframe(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Map every row of a parsed file to vCard fields. Large frames are split across
+        worker processes (see PARALLEL_MAP_MIN_ROWS); records keep the input order.
         """
-        Insert record into hybrid database:
-        1. Insert into PostgreSQL batch_records (5 searchable fields)
-        2. Insert into Cassandra contact_records (all fields)
+        workers = min(os.cpu_count() or 1, MAX_MAP_WORKERS)
+        if len(df) < PARALLEL_MAP_MIN_ROWS or workers < 2:
+            return self.mapper.map_dataframe(df)
+
+        step = -(-len(df) // workers)
+        slices = [df.iloc[i:i + step] for i in range(0, len(df), step)]
+        records: List[Dict[str, Any]] = []
+        for mapped in get_map_pool().map(_map_slice, repeat(self.mapper), slices):
+            records.extend(mapped)
+        return records
+
+    def build_record_rows(self, record: Dict[str, Any],
+                          now: Optional[datetime] = None) -> Tuple[tuple, tuple]:
+        """
+        Build the row tuples for one mapped record:
+        1. PostgreSQL batch_records (5 searchable fields)
+        2. Cassandra contact_records (all fields)
 
-        Returns: batch_record_id
+        `now` is used for created_at/updated_at; callers building a whole flush pass
+        one shared timestamp. Returns: (pg_values, cassandra_values), sharing one
+        generated batch_record_id
         """
-        try:
-            # Generate UUID for this record
-            batch_record_id = str(uuid.uuid4())
+        # Generate UUID for this record; both drivers take uuid.UUID directly
+        batch_record_id = uuid.uuid4()
+        if now is None:
             now = datetime.now()
 
-            # 1. Insert into PostgreSQL (5 searchable fields)
+        try:
+            pg_fields = _PG_RECORD_FIELDS(record)
+            cassandra_fields = _CASSANDRA_RECORD_FIELDS(record)
+        except KeyError:
+            # Partial dicts (not from map_row/map_dataframe): missing fields are NULL
+            pg_fields = tuple(record.get(key) for key in PG_RECORD_KEYS)
+            cassandra_fields = tuple(record.get(key) for key in CASSANDRA_RECORD_KEYS)
+
+        pg_values = (batch_record_id, self.batch_uuid, *pg_fields, now, now)
+
+        cassandra_values = (
+            batch_record_id,
+            self.batch_uuid,
+            now,
+            now,
+            *cassandra_fields,
+            {}  # empty map for extra field
+        )
+
+        return pg_values, cassandra_values
+
+    def insert_records(self, pg_rows: List[tuple], cassandra_rows: List[tuple]):
+        """
+        Insert one flush of records into the hybrid database:
+        1. PostgreSQL batch_records - a single multi-row INSERT (execute_values)
+        2. Cassandra contact_records - prepared statement, pipelined with
+           execute_concurrent_with_args instead of one blocking round-trip per row
+
+        PostgreSQL is committed only once every Cassandra write in the flush succeeded.
+        """
+        try:
             cursor = self.pg_conn.cursor()
-            pg_stmt = """
-                INSERT INTO batch_records
-                (id, batch_id, full_name, work_phone, mobile_phone, email, business_name, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            pg_values = (
-                batch_record_id,
-                self.batch_id,
-                record.get('full_name'),
-                record.get('work_phone'),
-                record.get('mobile_phone'),
-                record.get('email'),
-                record.get('business_name'),
-                now,
-                now
+            execute_values(cursor, PG_INSERT_RECORDS_SQL, pg_rows, page_size=INSERT_BATCH_SIZE)
+
+            results = execute_concurrent_with_args(
+                self.cassandra_session,
+                self.cassandra_prepared_stmt,
+                cassandra_rows,
+                concurrency=CASSANDRA_INSERT_CONCURRENCY,
+                raise_on_first_error=False
             )
+            failures = [result.result_or_exc for result in results if not result.success]
+            if failures:
+                logger.error("❌ Cassandra INSERT failed for %d/%d record(s)", len(failures), len(cassandra_rows))
+                raise failures[0]
 
-            logger.info("=" * 80)
-            logger.info("EXECUTING: PostgreSQL INSERT INTO batch_records")
-            logger.info(f"Statement placeholders: {pg_stmt.count('%s')}")
-            logger.info(f"Values count: {len(pg_values)}")
-            logger.info(f"Values: {pg_values}")
-            logger.info("=" * 80)
+            self.pg_conn.commit()
 
-            try:
-                cursor.execute(pg_stmt, pg_values)
-                logger.info("✅ PostgreSQL INSERT executed successfully")
-            except Exception as e:
-                logger.error(f"❌ PostgreSQL INSERT failed!")
-                logger.error(f"Error type: {type(e).__name__}")
-                logger.error(f"Error message: {str(e)}")
-                logger.error(f"Traceback:\n{traceback.format_exc()}")
-                raise
-
-            # 2. Insert into Cassandra (all vCard fields) using prepared statement
-            cassandra_values = (
-                uuid.UUID(batch_record_id),
-                uuid.UUID(self.batch_id),
-                now,
-                now,
-                record.get('full_name'),
-                record.get('first_name'),
-                record.get('last_name'),
-                record.get('work_phone'),
-                record.get('work_phone_ext'),
-                record.get('mobile_phone'),
-                record.get('email'),
-                record.get('address_street'),
-                record.get('address_city'),
-                record.get('address_state'),
-                record.get('address_postal'),
-                record.get('address_country'),
-                record.get('social_instagram'),
-                record.get('social_twitter'),
-                record.get('social_facebook'),
-                record.get('business_name'),
-                record.get('business_title'),
-                record.get('business_department'),
-                record.get('business_url'),
-                record.get('business_hours'),
-                record.get('business_address_street'),
-                record.get('business_address_city'),
-                record.get('business_address_state'),
-                record.get('business_address_postal'),
-                record.get('business_address_country'),
-                record.get('business_linkedin'),
-                record.get('business_twitter'),
-                record.get('personal_url'),
-                record.get('personal_bio'),
-                record.get('personal_birthday'),
-                {}  # empty map for extra field
-            )
+        except Exception as e:
+            logger.exception("❌ Failed to insert records: %s", e)
+            # Don't leave this flush's PostgreSQL rows pending - the ERROR status update
+            # commits on the same connection
+            self.pg_conn.rollback()
+            raise
 
-            logger.info("=" * 80)
-            logger.info("EXECUTING: Cassandra INSERT INTO contact_records (using prepared statement)")
-            logger.info(f"Values count: {len(cassandra_values)}")
-            logger.info(f"Values (first 10): {cassandra_values[:10]}")
-            logger.info(f"Record data: {record}")
-            logger.info("=" * 80)
+    def delete_batch_records(self, extra_record_ids: List[uuid.UUID]):
+        """
+        Remove this batch's records from both databases after a failed parse, so a
+        file that breaks partway through doesn't leave the flushes before it behind.
+        extra_record_ids covers Cassandra rows of a flush whose PostgreSQL half was
+        rolled back.
+        """
+        delete_stmt = self.cassandra_session.prepare(CASSANDRA_DELETE_CQL)
 
-            try:
-                self.cassandra_session.execute(self.cassandra_prepared_stmt, cassandra_values)
-                logger.info("✅ Cassandra INSERT executed successfully")
-            except Exception as e:
-                logger.error(f"❌ Cassandra INSERT failed!")
-                logger.error(f"Error type: {type(e).__name__}")
-                logger.error(f"Error message: {str(e)}")
-                logger.error(f"Full values: {cassandra_values}")
-                logger.error(f"Traceback:\n{traceback.format_exc()}")
-                raise
-
-            return batch_record_id
+        def _delete_from_cassandra(record_ids):
+            if record_ids:
+                execute_concurrent_with_args(
+                    self.cassandra_session,
+                    delete_stmt,
+                    [(record_id,) for record_id in record_ids],
+                    concurrency=CASSANDRA_INSERT_CONCURRENCY
+                )
 
-        except Exception as e:
-            logger.error(f"❌ Failed to insert record: {e}")
-            logger.error(f"Full traceback:\n{traceback.format_exc()}")
+        try:
+            with self.pg_conn.cursor(name='failed_batch_record_ids') as cursor:
+                cursor.itersize = INSERT_BATCH_SIZE
+                cursor.execute(PG_SELECT_BATCH_RECORD_IDS_SQL, (self.batch_id,))
+                while True:
+                    rows = cursor.fetchmany(INSERT_BATCH_SIZE)
+                    if not rows:
+                        break
+                    _delete_from_cassandra([uuid.UUID(row[0]) for row in rows])
+            _delete_from_cassandra(extra_record_ids)
+
+            cursor = self.pg_conn.cursor()
+            cursor.execute(PG_DELETE_BATCH_RECORDS_SQL, (self.batch_id,))
+            self.pg_conn.commit()
+            logger.info("🧹 Removed records written before the failure")
+        except Exception:
+            self.pg_conn.rollback()
             raise
 
     def parse_and_store(self):
         """Main parsing and storage workflow"""
         local_file_path = None
+        records_flushed = 0
+        in_flight: List[tuple] = []  # Cassandra rows of a flush that may be partly written
         try:
             # Update status to PARSING
             self.update_batch_status('PARSING')
@@ -475,51 +669,67 @@ class BatchParser:
             local_file_path = self.storage_client.download(self.file_path)
             logger.info(f"✅ Downloaded to: {local_file_path}")
 
-            # Parse file
+            # Parse file chunk by chunk, writing to both databases in flushes of
+            # INSERT_BATCH_SIZE as records are mapped
             logger.info(f"📄 Parsing file: {local_file_path}")
-            df = self.file_parser.parse_file(local_file_path)
-
-            if df.empty:
-                raise ValueError("No data extracted from file")
-
-            logger.info(f"📊 Found {len(df)} rows to process")
-
-            rows_in_file = len(df)
-            limit_reached = False
-
-            # Process each row
+            rows_in_file = 0
             records_processed = 0
-            for idx, row in df.iterrows():
+            limit_reached = False
+            pg_rows: List[tuple] = []
+            cassandra_rows: List[tuple] = []
+            for df in self.file_parser.iter_chunks(local_file_path):
+                rows_in_file += len(df)
                 if self.max_records is not None and self.max_records >= 0:
-                    if records_processed >= self.max_records:
+                    remaining = self.max_records - records_processed
+                    if len(df) > remaining:
+                        # Past the limit: keep counting the file's rows, skip mapping them
                         limit_reached = True
-                        logger.info(
-                            f"⏹️  Reached batch record limit ({self.max_records}); "
-                            f"skipping remaining {rows_in_file - records_processed} row(s)"
-                        )
-                        break
+                        df = df.head(remaining)
+                        if df.empty:
+                            continue
 
+                # Map the chunk's rows to vCard fields at once
                 try:
-                    # Map row to vCard fields
-                    mapped_record = self.map_row(row)
-
-                    # Insert into both databases
-                    batch_record_id = self.insert_record(mapped_record)
+                    mapped_records = self.map_dataframe(df)
+                except Exception as e:
+                    logger.error(f"❌ Failed to map rows: {e}")
+                    # Don't continue - let the error propagate so we know about failures
+                    raise
 
+                for mapped_record in mapped_records:
+                    # One timestamp per flush instead of one per row
+                    if not pg_rows:
+                        flush_ts = datetime.now()
+                    pg_values, cassandra_values = self.build_record_rows(mapped_record, flush_ts)
+                    pg_rows.append(pg_values)
+                    cassandra_rows.append(cassandra_values)
                     records_processed += 1
 
-                    if records_processed % 100 == 0:
-                        logger.info(f"⏳ Processed {records_processed}/{len(df)} records...")
-                        self.pg_conn.commit()  # Commit every 100 records
+                    if len(pg_rows) >= INSERT_BATCH_SIZE:
+                        in_flight = cassandra_rows
+                        self.insert_records(pg_rows, cassandra_rows)
+                        in_flight = []
+                        records_flushed += len(pg_rows)
+                        pg_rows, cassandra_rows = [], []
+                        logger.info("⏳ Processed %d records...", records_processed)
 
-                except Exception as e:
-                    logger.error(f"❌ Failed to process row {idx}: {e}")
-                    # Don't continue - let the error propagate so we know about failures
-                    # This prevents silent data loss where PostgreSQL succeeds but Cassandra fails
-                    raise
+            if rows_in_file == 0:
+                raise ValueError("No data extracted from file")
 
-            # Final commit
-            self.pg_conn.commit()
+            logger.info(f"📊 Found {rows_in_file} rows in file")
+
+            if limit_reached:
+                logger.info(
+                    f"⏹️  Reached batch record limit ({self.max_records}); "
+                    f"skipped remaining {rows_in_file - records_processed} row(s)"
+                )
+
+            # Final flush
+            if pg_rows:
+                in_flight = cassandra_rows
+                self.insert_records(pg_rows, cassandra_rows)
+                in_flight = []
+                records_flushed += len(pg_rows)
 
             # Update batch status to PARSED
             self.update_batch_status(
@@ -551,6 +761,11 @@ class BatchParser:
 
         except Exception as e:
             logger.error(f"❌ Parsing failed: {e}")
+            if records_flushed or in_flight:
+                try:
+                    self.delete_batch_records([row[0] for row in in_flight])
+                except Exception as cleanup_error:
+                    logger.exception(f"❌ Failed to remove partial records: {cleanup_error}")
             self.update_batch_status('ERROR', error_message=str(e))
             return {
                 'success': False,
@@ -563,23 +778,62 @@ class BatchParser:
                 self.storage_client.cleanup(local_file_path)
 
     def close_connections(self):
-        """Close all database connections"""
+        """Release database connections back to the shared pool/session"""
         if self.pg_conn:
-            self.pg_conn.close()
-            logger.info("🔌 PostgreSQL connection closed")
-        if self.cassandra_session:
-            self.cassandra_session.cluster.shutdown()
-            logger.info("🔌 Cassandra connection closed")
+            get_pg_pool(self.postgres_url).putconn(self.pg_conn)
+            self.pg_conn = None
+            logger.info("🔌 PostgreSQL connection returned to pool")
+        self.cassandra_session = None
+
+# Per-batch fields a --daemon job line may set; everything else comes from the CLI
+# (the CLI's phone/limit options act as defaults for jobs that omit them)
+DAEMON_JOB_FIELDS = ('batch_id', 'file_path', 'work_phone_prefix', 'default_country_code', 'max_records')
+
+
+def run_daemon(config: Dict[str, Any]):
+    """
+    Process batches read from stdin, one JSON job per line, in this process.
+    Writes one JSON result per line to stdout (with the job's batch_id), so imports
+    and database connections are paid once for every batch the worker handles.
+    """
+    logger.info("👂 Waiting for batch jobs on stdin")
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        batch_id = None
+        try:
+            job = json.loads(line)
+            batch_id = job.get('batch_id')
+            unknown = set(job) - set(DAEMON_JOB_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown job field(s): {', '.join(sorted(unknown))}")
+
+            batch_parser = BatchParser(**{**config, **job})
+            try:
+                batch_parser.connect_databases()
+                result = batch_parser.parse_and_store()
+            finally:
+                batch_parser.close_connections()
+        except Exception as e:
+            logger.error(f"❌ Batch job failed: {e}")
+            result = {'success': False, 'error': str(e)}
+
+        print(json.dumps({'batch_id': batch_id, **result}), flush=True)
+
 
 def main():
     parser = argparse.ArgumentParser(description='Parse batch file and store to hybrid database')
-    parser.add_argument('--batch-id', required=True, help='Batch UUID')
-    parser.add_argument('--file-path', required=True, help='Storage path to file (e.g., batches/email/project/file.csv)')
+    parser.add_argument('--batch-id', help='Batch UUID (required unless --daemon)')
+    parser.add_argument('--file-path', help='Storage path to file (e.g., batches/email/project/file.csv)')
     parser.add_argument('--postgres-url', required=True, help='PostgreSQL connection URL')
     parser.add_argument('--cassandra-hosts', required=True, help='Cassandra hosts (comma-separated)')
     parser.add_argument('--cassandra-keyspace', default='ecards', help='Cassandra keyspace')
     parser.add_argument('--storage-mode', default='seaweedfs', choices=['seaweedfs', 'local'], help='Storage mode')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Stay running and process JSON batch jobs read line by line from stdin')
     # Phone formatting configuration
     parser.add_argument('--work-phone-prefix', help='Prefix for 4-digit work phone numbers (e.g., "2222")')
     parser.add_argument('--default-country-code', help='Default country code for 8-digit numbers (e.g., "+(506)")')
@@ -587,12 +841,31 @@ def main():
 
     args = parser.parse_args()
 
+    if not args.daemon and not (args.batch_id and args.file_path):
+        parser.error('--batch-id and --file-path are required unless --daemon is set')
+
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
     # Parse comma-separated Cassandra hosts
     cassandra_hosts = [h.strip() for h in args.cassandra_hosts.split(',')]
 
+    if args.daemon:
+        try:
+            run_daemon({
+                'postgres_url': args.postgres_url,
+                'cassandra_hosts': cassandra_hosts,
+                'cassandra_keyspace': args.cassandra_keyspace,
+                'storage_mode': args.storage_mode,
+                # Defaults for jobs that don't set their own
+                'work_phone_prefix': args.work_phone_prefix,
+                'default_country_code': args.default_country_code,
+                'max_records': args.max_records,
+            })
+        finally:
+            close_shared_connections()
+        return
+
     # Initialize parser
     batch_parser = BatchParser(
         batch_id=args.batch_id,
@@ -626,6 +899,7 @@ def main():
 
     finally:
         batch_parser.close_connections()
+        close_shared_connections()
 
 if __name__ == "__main__":
     main()
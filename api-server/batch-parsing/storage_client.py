@@ -3,19 +3,121 @@ Storage Client Module
 Handles file download from SeaweedFS (S3-compatible) or local filesystem
 """
 
+import atexit
 import os
 import tempfile
 import logging
-from pathlib import Path
-from typing import Optional
+import multiprocessing
+import threading
+from typing import BinaryIO, Dict, Optional, Tuple
 from urllib.parse import urlparse
+from uuid import uuid4
 
 import boto3
+from boto3.s3.transfer import HAS_CRT, TransferConfig
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+
+def _build_transfer_config() -> TransferConfig:
+    """
+    Multipart download settings for SeaweedFS: parallel ranged GETs with a larger
+    IO buffer than s3transfer's defaults. Tunable per deployment (LAN vs same-region).
+    """
+    # A co-located SeaweedFS serves one stream faster than many ranged GETs, so
+    # multipart is effectively off there unless a threshold is set explicitly
+    default_threshold_mb = '1024' if os.getenv('SEAWEEDFS_COLOCATED') == '1' else '8'
+    # 'crt' hands transfers to the AWS CRT's native S3 client (needs boto3[crt]);
+    # s3transfer falls back to the classic manager if CRT can't serve this client
+    transfer_client = os.getenv('S3_TRANSFER_CLIENT', 'classic')
+    if transfer_client == 'crt' and not HAS_CRT:
+        logger.warning("S3_TRANSFER_CLIENT=crt but awscrt is not installed; using classic transfers")
+        transfer_client = 'classic'
+    return TransferConfig(
+        multipart_threshold=int(os.getenv('S3_MULTIPART_THRESHOLD_MB', default_threshold_mb)) * MB,
+        multipart_chunksize=int(os.getenv('S3_MULTIPART_CHUNKSIZE_MB', '16')) * MB,
+        max_concurrency=int(os.getenv('S3_MAX_CONCURRENCY', '16')),
+        io_chunksize=MB,
+        max_io_queue=1000,
+        use_threads=True,
+        preferred_transfer_client=transfer_client,
+    )
+
+
+# One boto3 session per process, so credentials/endpoint config are resolved once
+_SESSION = boto3.session.Session()
+_session_lock = threading.Lock()  # Session.client() is not thread-safe
+
+
+def _build_s3_client():
+    """boto3 S3 client for SeaweedFS"""
+    with _session_lock:
+        return _SESSION.client(
+            's3',
+            endpoint_url=os.getenv('SEAWEEDFS_ENDPOINT', 'http://seaweedfs:8333'),
+            aws_access_key_id=os.getenv('SEAWEEDFS_ACCESS_KEY', 'admin'),
+            aws_secret_access_key=os.getenv('SEAWEEDFS_SECRET_KEY', 'admin'),
+            config=Config(
+                signature_version='s3v4',
+                # Room for S3_MAX_CONCURRENCY ranged GETs per download
+                max_pool_connections=64,
+                tcp_keepalive=True,
+                retries={'max_attempts': 5, 'mode': 'adaptive'},
+                connect_timeout=5,
+                read_timeout=60
+            ),
+            region_name=os.getenv('SEAWEEDFS_REGION', 'us-east-1'),
+        )
+
+
+def _preallocate(f: BinaryIO, size: int):
+    """
+    Size f to size bytes up front, allocating its blocks in one call where supported,
+    so out-of-order ranged writes don't grow the file extent by extent
+    """
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # e.g. EOPNOTSUPP on filesystems without fallocate
+    f.truncate(size)
+
+
+# Objects at least this large (when their size is already known) are fetched by a pool
+# of processes, each with its own client, instead of s3transfer's GIL-bound threads
+MP_DOWNLOAD_MIN_BYTES = int(os.getenv('S3_MP_DOWNLOAD_MIN_MB', '512')) * MB
+MP_DOWNLOAD_PROCESSES = 8
+
+_worker_s3_client = None
+
+
+def _init_download_worker():
+    global _worker_s3_client
+    _worker_s3_client = _build_s3_client()
+
+
+def _download_range(job: Tuple[str, str, str, int, int, str]) -> int:
+    """
+    Worker: GET bytes start..end of the object and pwrite them at the same offset
+    (IfMatch fails the range if the object changed since the HEAD that sized it)
+    """
+    bucket, key, temp_path, start, end, etag = job
+    response = _worker_s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes={start}-{end}', IfMatch=etag)
+    fd = os.open(temp_path, os.O_WRONLY)
+    try:
+        offset = start
+        for chunk in response['Body'].iter_chunks(MB):
+            offset += os.pwrite(fd, chunk, offset)
+    finally:
+        os.close(fd)
+    return offset - start
+
+
 class StorageClient:
     """
     Storage client for downloading batch files from SeaweedFS or local filesystem
@@ -30,25 +132,40 @@ class StorageClient:
             storage_mode: 'seaweedfs' or 'local'
         """
         self.storage_mode = storage_mode
-        self.temp_files = []  # Track temp files for cleanup
+        self.temp_files = set()  # Track temp files for cleanup
+        self._temp_files_lock = threading.Lock()  # Guards temp_files and _tmp_root
+        self._tmp_root: Optional[tempfile.TemporaryDirectory] = None  # Holds every downloaded temp file
+        # Storage key -> head_object response (or known ContentLength). Only a hint for
+        # picking the download path; entries are dropped when their file is cleaned up.
+        self._meta_cache: Dict[str, dict] = {}
+        self._path_keys: Dict[str, str] = {}  # Local/temp path handed out -> its storage key
+
+        self._s3_client = None  # Built on first use (see s3_client)
+        self._s3_client_lock = threading.Lock()
 
         if storage_mode == 'seaweedfs':
-            # Initialize S3-compatible client for SeaweedFS
-            self.s3_client = boto3.client(
-                's3',
-                endpoint_url=os.getenv('SEAWEEDFS_ENDPOINT', 'http://seaweedfs:8333'),
-                aws_access_key_id=os.getenv('SEAWEEDFS_ACCESS_KEY', 'admin'),
-                aws_secret_access_key=os.getenv('SEAWEEDFS_SECRET_KEY', 'admin'),
-                config=Config(signature_version='s3v4'),
-                region_name=os.getenv('SEAWEEDFS_REGION', 'us-east-1'),
-            )
+            # S3-compatible SeaweedFS settings; the client itself is built on first use
             self.bucket_name = os.getenv('SEAWEEDFS_BUCKET', 'repositories')
+            self._transfer_config = _build_transfer_config()
             logger.info(f"Initialized SeaweedFS client: endpoint={os.getenv('SEAWEEDFS_ENDPOINT')}, bucket={self.bucket_name}")
         else:
-            self.s3_client = None
             self.local_storage_path = os.getenv('LOCAL_STORAGE_PATH', '/app/uploads')
+            self._local_prefix = os.path.normpath(self.local_storage_path) + os.sep
             logger.info(f"Initialized local storage client: path={self.local_storage_path}")
 
+    @property
+    def s3_client(self):
+        """S3 client, created on first use (None in local mode)"""
+        if self._s3_client is None and self.storage_mode == 'seaweedfs':
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = _build_s3_client()
+        return self._s3_client
+
+    @s3_client.setter
+    def s3_client(self, client):
+        self._s3_client = client
+
     def download(self, file_path: str) -> str:
         """
         Download file from storage to local temp directory
@@ -75,21 +192,44 @@ class StorageClient:
             Local temp file path
         """
         try:
-            # Create temp file with same extension
-            file_ext = Path(file_path).suffix
-            temp_fd, temp_path = tempfile.mkstemp(suffix=file_ext, prefix='batch_')
-            os.close(temp_fd)  # Close fd, we'll use the path
-
-            # Track for cleanup
-            self.temp_files.append(temp_path)
+            # Temp file with same extension, tracked for cleanup
+            file_ext = os.path.splitext(file_path)[1]
+            with self._temp_files_lock:
+                if self._tmp_root is None:
+                    self._tmp_root = tempfile.TemporaryDirectory(prefix='batch_')
+                temp_path = os.path.join(self._tmp_root.name, f'{uuid4().hex}{file_ext}')
+                self.temp_files.add(temp_path)
 
             # Download from SeaweedFS
             logger.info(f"Downloading from SeaweedFS: bucket={self.bucket_name}, key={file_path}")
-            self.s3_client.download_file(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Filename=temp_path
-            )
+            meta = self._meta_cache.get(file_path)
+            if meta is not None and meta['ContentLength'] < self._transfer_config.multipart_threshold:
+                # Size already known and below the multipart threshold: one GET, no
+                # HEAD from s3transfer (the file gets whatever that GET returns)
+                self._get_object_to_file(file_path, temp_path)
+            else:
+                if meta is not None:
+                    # A cached size may be stale; re-HEAD before sizing the file or ranges
+                    meta = self._head(file_path, refresh=True)
+
+                if meta is not None and meta['ContentLength'] >= MP_DOWNLOAD_MIN_BYTES:
+                    self._download_large_mp(file_path, temp_path, meta['ContentLength'], meta['ETag'])
+                else:
+                    # download_fileobj into our own file skips download_file's write to a
+                    # sibling temp name followed by a rename
+                    with open(temp_path, 'wb') as f:
+                        if meta is not None:
+                            _preallocate(f, meta['ContentLength'])
+                        self.s3_client.download_fileobj(
+                            Bucket=self.bucket_name,
+                            Key=file_path,
+                            Fileobj=f,
+                            Config=self._transfer_config
+                        )
+
+            # Remember the size so get_file_size doesn't need a HEAD for this key
+            self._meta_cache[file_path] = {'ContentLength': os.path.getsize(temp_path)}
+            self._path_keys[temp_path] = file_path
 
             logger.info(f"Downloaded to temp file: {temp_path}")
             return temp_path
@@ -102,6 +242,44 @@ class StorageClient:
             logger.error(f"Unexpected error downloading file: {str(e)}")
             raise
 
+    def _get_object_to_file(self, file_path: str, temp_path: str):
+        """
+        Stream a single GET of file_path into temp_path. ChecksumMode makes botocore
+        verify the object's stored checksum (CRC32C with awscrt) as the body streams
+        through, so there is no separate verification read of the temp file.
+        """
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path, ChecksumMode='ENABLED')
+        with open(temp_path, 'wb') as f:
+            for chunk in response['Body'].iter_chunks(MB):
+                f.write(chunk)
+
+    def _download_large_mp(self, file_path: str, temp_path: str, size: int, etag: str):
+        """
+        Fetch a large object with ranged GETs from MP_DOWNLOAD_PROCESSES processes;
+        each worker writes its range straight into the pre-sized temp file
+        """
+        chunk_size = self._transfer_config.multipart_chunksize
+        jobs = [
+            (self.bucket_name, file_path, temp_path, start, min(start + chunk_size, size) - 1, etag)
+            for start in range(0, size, chunk_size)
+        ]
+        with open(temp_path, 'wb') as f:
+            _preallocate(f, size)
+
+        ctx = multiprocessing.get_context('spawn')  # boto3 clients are not fork-safe
+        with ctx.Pool(processes=min(MP_DOWNLOAD_PROCESSES, len(jobs)), initializer=_init_download_worker) as pool:
+            written = sum(pool.imap_unordered(_download_range, jobs))
+        if written != size:
+            raise RuntimeError(f"SeaweedFS download incomplete: {written} of {size} bytes for {file_path}")
+
+    def _head(self, file_path: str, refresh: bool = False) -> dict:
+        """head_object for file_path, memoized per key unless refresh (raises ClientError)"""
+        meta = None if refresh else self._meta_cache.get(file_path)
+        if meta is None:
+            meta = self.s3_client.head_object(Bucket=self.bucket_name, Key=file_path)
+            self._meta_cache[file_path] = meta
+        return meta
+
     def _get_local_path(self, file_path: str) -> str:
         """
         Get local file path (for local storage mode)
@@ -113,42 +291,55 @@ class StorageClient:
             Absolute local file path
         """
         # Construct absolute path
-        abs_path = os.path.join(self.local_storage_path, file_path)
+        abs_path = self._local_prefix + file_path
 
-        # Verify file exists
-        if not os.path.exists(abs_path):
-            raise FileNotFoundError(f"Local file not found: {abs_path}")
+        # Verify file exists (the stat also answers get_file_size for this path)
+        try:
+            self._meta_cache[file_path] = {'ContentLength': os.stat(abs_path).st_size}
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Local file not found: {abs_path}") from None
+        self._path_keys[abs_path] = file_path
 
         logger.info(f"Using local file: {abs_path}")
         return abs_path
 
     def cleanup(self, file_path: Optional[str] = None):
         """
-        Cleanup temp files
+        Cleanup temp files, and forget the cached metadata of the keys they came from
 
         Args:
             file_path: Specific file to cleanup, or None to cleanup all tracked files
         """
         if file_path:
             # Cleanup specific file
-            if file_path in self.temp_files:
-                try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                        logger.debug(f"Cleaned up temp file: {file_path}")
-                    self.temp_files.remove(file_path)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
+            key = self._path_keys.pop(file_path, None)
+            if key is not None:
+                self._meta_cache.pop(key, None)
+            with self._temp_files_lock:
+                if file_path not in self.temp_files:
+                    return
+                self.temp_files.discard(file_path)
+            try:
+                os.unlink(file_path)
+                logger.debug(f"Cleaned up temp file: {file_path}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
         else:
-            # Cleanup all tracked temp files
-            for temp_file in self.temp_files[:]:  # Copy list to avoid modification during iteration
+            # Cleanup all tracked temp files by removing their directory (detached first,
+            # so a second call is a no-op and later downloads start a fresh directory)
+            with self._temp_files_lock:
+                tmp_root, self._tmp_root = self._tmp_root, None
+                self.temp_files = set()
+            self._path_keys.clear()
+            self._meta_cache.clear()
+            if tmp_root is not None:
                 try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                        logger.debug(f"Cleaned up temp file: {temp_file}")
+                    tmp_root.cleanup()
+                    logger.debug(f"Cleaned up temp directory: {tmp_root.name}")
                 except Exception as e:
-                    logger.warning(f"Failed to cleanup temp file {temp_file}: {e}")
-            self.temp_files.clear()
+                    logger.warning(f"Failed to cleanup temp directory {tmp_root.name}: {e}")
 
     def get_file_size(self, file_path: str) -> int:
         """
@@ -162,20 +353,41 @@ class StorageClient:
         """
         if self.storage_mode == 'seaweedfs':
             try:
-                response = self.s3_client.head_object(
-                    Bucket=self.bucket_name,
-                    Key=file_path
-                )
-                return response['ContentLength']
+                return self._head(file_path)['ContentLength']
             except ClientError as e:
                 logger.error(f"Failed to get file size from SeaweedFS: {e}")
                 return 0
         else:
-            abs_path = os.path.join(self.local_storage_path, file_path)
-            if os.path.exists(abs_path):
-                return os.path.getsize(abs_path)
-            return 0
+            meta = self._meta_cache.get(file_path)
+            if meta is not None:
+                return meta['ContentLength']
+            abs_path = self._local_prefix + file_path
+            try:
+                return os.stat(abs_path).st_size
+            except FileNotFoundError:
+                return 0
+
+    def __enter__(self) -> 'StorageClient':
+        return self
 
-    def __del__(self):
-        """Cleanup on destruction"""
+    def __exit__(self, exc_type, exc_val, exc_tb):
         self.cleanup()
+
+
+_shared_clients: Dict[str, StorageClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_storage_client(storage_mode: str = 'seaweedfs') -> StorageClient:
+    """
+    Shared StorageClient for storage_mode, so the boto3 client, its connection pool
+    and the transfer settings are built once per process
+    """
+    client = _shared_clients.get(storage_mode)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(storage_mode)
+            if client is None:
+                client = _shared_clients[storage_mode] = StorageClient(storage_mode)
+                atexit.register(client.cleanup)
+    return client
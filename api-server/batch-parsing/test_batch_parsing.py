@@ -12,10 +12,16 @@ installed there, not on the host):
       sh -c "cd /app/batch-parsing && python3 -m unittest test_batch_parsing -v"
 """
 
+import json
 import os
+import shutil
 import tempfile
 import unittest
+import uuid
+from datetime import datetime
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 
 from data_normalizer import (
@@ -26,6 +32,7 @@ from data_normalizer import (
 )
 from file_parser import FileParser
 from parser import BatchParser
+from storage_client import StorageClient, get_storage_client
 
 
 class FuzzyFieldMatchTests(unittest.TestCase):
@@ -106,6 +113,119 @@ class CanonicalFieldMatchTests(unittest.TestCase):
         self.assertEqual(underscored["business_address_street"], "456 Business Ave")
 
 
+class FormatFieldTests(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = DataNormalizer()
+
+    def test_smart_title_without_parens(self):
+        self.assertEqual(
+            self.normalizer.format_field("address_city", "san josé de la montaña"),
+            "San José de la Montaña",
+        )
+
+    def test_title_without_parens_keeps_initials(self):
+        self.assertEqual(self.normalizer.format_field("first_name", "j.p. smith"), "j.p. Smith")
+
+    def test_title_preserves_parenthesized_text(self):
+        self.assertEqual(
+            self.normalizer.format_field("business_hours", "mon-fri (9am-5pm)"),
+            "Mon-Fri (9am-5pm)",
+        )
+
+    def test_missing_values_are_blank(self):
+        for value in (None, float("nan"), pd.NA, pd.NaT, np.float32("nan"), np.datetime64("NaT"), "   "):
+            with self.subTest(value=value):
+                self.assertEqual(self.normalizer.format_field("first_name", value), "")
+                self.assertEqual(self.normalizer.normalize_phone(value), "")
+                self.assertEqual(self.normalizer.parse_name(value)["full_name"], "")
+
+    def test_smart_title_preserves_parenthesized_text(self):
+        self.assertEqual(
+            self.normalizer.format_field("address_city", "heredia (centro) de costa rica"),
+            "Heredia (centro) de Costa Rica",
+        )
+
+
+class FormatColumnTests(unittest.TestCase):
+    """format_column must produce exactly what format_field does cell by cell."""
+
+    VALUES = [
+        "san josé de la montaña", "  heredia   (centro) ", None, float("nan"), "", "  ",
+        "j.p. smith", "john a smith", "MON-FRI 9AM", "o'brien 3rd", "Acme (CR) S.A.",
+        "X@Example.COM", 1.0, "lunes a viernes  (8am  -  5pm)",
+    ]
+
+    def test_matches_format_field_per_cell(self):
+        normalizer = DataNormalizer()
+        series = pd.Series(self.VALUES, dtype=object)
+        for key in ("first_name", "business_hours", "address_city", "email", "business_name"):
+            with self.subTest(key=key):
+                self.assertEqual(
+                    normalizer.format_column(key, series).tolist(),
+                    [normalizer.format_field(key, v) for v in self.VALUES],
+                )
+
+
+class NormalizePhoneTests(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = DataNormalizer()
+
+    def test_eight_digits_get_country_code(self):
+        self.assertEqual(
+            self.normalizer.normalize_phone("2233 4455", default_country_code="+(506)"),
+            "+(506) 2233-4455",
+        )
+
+    def test_repeated_number_honours_per_call_settings(self):
+        # Results are cached per (value, settings) — a different prefix/country code
+        # for the same raw value must not return the earlier answer.
+        self.assertEqual(
+            self.normalizer.normalize_phone("6088", phone_type="work", work_phone_prefix="2459"),
+            "2459-6088",
+        )
+        self.assertEqual(
+            self.normalizer.normalize_phone("6088", phone_type="work", work_phone_prefix="2222"),
+            "2222-6088",
+        )
+        self.assertEqual(self.normalizer.normalize_phone("6088", phone_type="mobile"), "6088")
+
+    def test_e164_and_blank_values(self):
+        self.assertEqual(self.normalizer.normalize_phone("+50622334455"), "+50622334455")
+        self.assertEqual(self.normalizer.normalize_phone(float("nan")), "")
+        self.assertEqual(self.normalizer.normalize_phone("  "), "")
+
+
+class ParseNameTests(unittest.TestCase):
+    def setUp(self):
+        self.normalizer = DataNormalizer()
+
+    def test_spanish_surname_first_four_tokens(self):
+        parsed = self.normalizer.parse_name("Rodriguez Perez Maria Jose")
+        self.assertEqual(parsed["first_name"], "Maria Jose")
+        self.assertEqual(parsed["last_name"], "Rodriguez Perez")
+        self.assertEqual(parsed["full_name"], "Maria Jose Rodriguez Perez")
+
+    def test_all_caps_three_tokens_is_surname_first(self):
+        parsed = self.normalizer.parse_name("GOMEZ PEREZ ANA")
+        self.assertEqual(parsed["first_name"], "Ana")
+        self.assertEqual(parsed["last_name"], "Gomez Perez")
+
+    def test_leading_given_name_is_normal_order(self):
+        parsed = self.normalizer.parse_name("josé maría álvarez quirós")
+        self.assertEqual(parsed["first_name"], "José María")
+        self.assertEqual(parsed["last_name"], "Álvarez Quirós")
+
+    def test_blank_name(self):
+        self.assertEqual(self.normalizer.parse_name("  ")["full_name"], "")
+
+    def test_parse_names_matches_parse_name(self):
+        names = pd.Series(["GOMEZ PEREZ ANA", None, "john smith"], index=[10, 11, 12])
+        parsed = self.normalizer.parse_names(names)
+        self.assertEqual(list(parsed.index), [10, 11, 12])
+        for idx, name in names.items():
+            self.assertEqual(parsed.loc[idx].to_dict(), self.normalizer.parse_name(name))
+
+
 class PhoneExtensionReconciliationTests(unittest.TestCase):
     def setUp(self):
         self.normalizer = DataNormalizer()
@@ -194,6 +314,330 @@ class MapRowIntegrationTests(unittest.TestCase):
         # the second work_phone-shaped header must not silently overwrite it.
         self.assertEqual(mapped["work_phone"], "2222-1111")
 
+    def test_exact_alias_priority_follows_field_mapping_order(self):
+        # Both headers are exact work_phone aliases; "phone" is listed before
+        # "telefono" in FIELD_MAPPING, regardless of column order in the file.
+        row = pd.Series({
+            "Telefono": "88889999",
+            "Phone": "22221111",
+        })
+        mapped = self.parser.map_row(row)
+        self.assertEqual(mapped["work_phone"], "2222-1111")
+
+    def test_map_row_accepts_plain_dict(self):
+        row = {"Nombre": "Ana Gomez", "Correo": "ana@example.com", "Telefono": 22221111.0}
+        self.assertEqual(self.parser.map_row(row), self.parser.map_row(pd.Series(row)))
+
+    def test_map_dataframe_matches_map_row(self):
+        df = pd.DataFrame({
+            "Nombre": ["Sofia Rodriguez", "Luis", None],
+            "Correo": ["sofia@example.com", "", "ana@example.com"],
+            "Telefono": ["105", 22221111.0, None],
+            "Ext": ["22334455", "0", None],
+            "Telefono Oficina 2": [None, "88889999", "22221111"],
+        })
+        expected = [self.parser.map_row(df.iloc[i]) for i in range(len(df))]
+        self.assertEqual(self.parser.map_dataframe(df), expected)
+
+    def test_parallel_map_dataframe_keeps_row_order(self):
+        import parser as batch_parser_module
+
+        df = pd.DataFrame({
+            "Nombre": [f"Persona {i} Mora" for i in range(40)],
+            "Telefono": [str(22220000 + i) for i in range(40)],
+        })
+        with mock.patch.object(batch_parser_module, "PARALLEL_MAP_MIN_ROWS", 2), \
+                mock.patch("os.cpu_count", return_value=2):
+            try:
+                records = self.parser.map_dataframe(df)
+            finally:
+                batch_parser_module.close_shared_connections()
+        self.assertEqual(records, self.parser.mapper.map_dataframe(df))
+
+
+class InsertRecordsTests(unittest.TestCase):
+    """Batched writes: PostgreSQL commits only if every Cassandra write succeeded."""
+
+    def setUp(self):
+        self.parser = _make_batch_parser()
+        self.parser.pg_conn = mock.MagicMock()
+        self.parser.cassandra_session = mock.MagicMock()
+        self.parser.cassandra_prepared_stmt = mock.MagicMock()
+        rows = [self.parser.build_record_rows({"full_name": f"Person {i}"}) for i in range(3)]
+        self.pg_rows = [r[0] for r in rows]
+        self.cassandra_rows = [r[1] for r in rows]
+
+    def _insert(self, cassandra_results):
+        with mock.patch("parser.execute_values") as execute_values, \
+                mock.patch("parser.execute_concurrent_with_args", return_value=cassandra_results):
+            self.parser.insert_records(self.pg_rows, self.cassandra_rows)
+        return execute_values
+
+    def test_build_record_rows_shares_id_and_timestamp(self):
+        now = datetime(2024, 1, 2, 3, 4, 5)
+        pg_values, cassandra_values = self.parser.build_record_rows({"full_name": "Ana"}, now)
+        self.assertIs(pg_values[0], cassandra_values[0])
+        self.assertEqual(pg_values[7:9], (now, now))
+        self.assertEqual(cassandra_values[2:4], (now, now))
+
+    def test_success_writes_one_pg_statement_and_commits(self):
+        ok = mock.Mock(success=True, result_or_exc=None)
+        execute_values = self._insert([ok, ok, ok])
+        execute_values.assert_called_once()
+        self.assertEqual(execute_values.call_args[0][2], self.pg_rows)
+        self.parser.pg_conn.commit.assert_called_once()
+
+    def test_cassandra_failure_rolls_back_and_raises(self):
+        ok = mock.Mock(success=True, result_or_exc=None)
+        failed = mock.Mock(success=False, result_or_exc=RuntimeError("write timeout"))
+        with self.assertRaises(RuntimeError):
+            self._insert([ok, failed, ok])
+        self.parser.pg_conn.commit.assert_not_called()
+        self.parser.pg_conn.rollback.assert_called_once()
+
+
+class ParseAndStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.parser = _make_batch_parser()
+        self.parser.pg_conn = mock.MagicMock()
+        self.parser.cassandra_session = mock.MagicMock()
+        self.chunks_read = 0
+        patches = [
+            mock.patch("parser.time.sleep"),
+            mock.patch("parser.INSERT_BATCH_SIZE", 2),
+            mock.patch.object(self.parser.storage_client, "download", return_value="contacts.csv"),
+            mock.patch.object(self.parser.storage_client, "cleanup"),
+            mock.patch.object(self.parser, "insert_records"),
+            mock.patch.object(self.parser, "delete_batch_records"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _chunks(self, count, fail=False):
+        for i in range(count):
+            self.chunks_read += 1
+            yield pd.DataFrame({"Nombre": [f"Ana {i}", f"Luis {i}"]})
+        if fail:
+            raise pd.errors.ParserError("Expected 3 fields in line 7, saw 4")
+
+    def test_error_after_a_flush_removes_written_records(self):
+        with mock.patch.object(self.parser.file_parser, "iter_chunks", return_value=self._chunks(2, fail=True)):
+            result = self.parser.parse_and_store()
+        self.assertFalse(result["success"])
+        self.assertEqual(self.parser.insert_records.call_count, 2)
+        self.parser.delete_batch_records.assert_called_once_with([])
+
+    def test_error_before_any_flush_writes_nothing(self):
+        with mock.patch.object(self.parser.file_parser, "iter_chunks", return_value=self._chunks(0, fail=True)):
+            result = self.parser.parse_and_store()
+        self.assertFalse(result["success"])
+        self.parser.insert_records.assert_not_called()
+        self.parser.delete_batch_records.assert_not_called()
+
+    def test_record_limit_still_counts_the_whole_file(self):
+        self.parser.max_records = 3
+        with mock.patch.object(self.parser.file_parser, "iter_chunks", return_value=self._chunks(5)), \
+                mock.patch.object(self.parser, "map_dataframe", wraps=self.parser.map_dataframe) as map_dataframe:
+            result = self.parser.parse_and_store()
+        self.assertTrue(result["success"])
+        self.assertEqual(result["records_processed"], 3)
+        self.assertEqual(result["records_total"], 10)
+        self.assertTrue(result["limit_reached"])
+        self.assertEqual(self.chunks_read, 5)
+        self.assertEqual(map_dataframe.call_count, 2)
+
+    def test_delete_batch_records_clears_both_databases(self):
+        record_id = uuid.uuid4()
+        named_cursor = self.parser.pg_conn.cursor.return_value.__enter__.return_value
+        named_cursor.fetchmany.side_effect = [[(str(record_id),)], []]
+        with mock.patch("parser.execute_concurrent_with_args") as execute_concurrent:
+            BatchParser.delete_batch_records(self.parser, [])
+        execute_concurrent.assert_called_once()
+        self.assertEqual(execute_concurrent.call_args[0][2], [(record_id,)])
+        self.parser.pg_conn.cursor.return_value.execute.assert_called_with(
+            "DELETE FROM batch_records WHERE batch_id = %s", (self.parser.batch_id,)
+        )
+        self.parser.pg_conn.commit.assert_called_once()
+
+
+class DaemonModeTests(unittest.TestCase):
+    def test_one_result_line_per_job(self):
+        import io
+        import parser as batch_parser_module
+
+        jobs = io.StringIO(
+            '{"batch_id": "b1", "file_path": "a.csv", "max_records": 5}\n'
+            '\n'
+            '{"batch_id": "b2", "file_path": "b.csv", "bogus": 1}\n'
+        )
+        stdout = io.StringIO()
+        with mock.patch.object(batch_parser_module, "BatchParser") as batch_parser_cls, \
+                mock.patch("sys.stdin", jobs), mock.patch("sys.stdout", stdout):
+            batch_parser_cls.return_value.parse_and_store.return_value = {"success": True}
+            batch_parser_module.run_daemon({"postgres_url": "pg", "max_records": None})
+
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(results[0], {"batch_id": "b1", "success": True})
+        self.assertEqual(results[1]["batch_id"], "b2")
+        self.assertFalse(results[1]["success"])
+        batch_parser_cls.assert_called_once_with(
+            postgres_url="pg", max_records=5, batch_id="b1", file_path="a.csv"
+        )
+        batch_parser_cls.return_value.close_connections.assert_called_once()
+
+
+class StorageClientTests(unittest.TestCase):
+    def setUp(self):
+        self.client = StorageClient("seaweedfs")
+        self.client.s3_client = mock.MagicMock()
+
+        def _fake_download(Bucket, Key, Fileobj, **kwargs):
+            Fileobj.write(b"Nombre,Correo\nAna,ana@example.com\n")
+
+        self.client.s3_client.download_fileobj.side_effect = _fake_download
+
+    def tearDown(self):
+        self.client.cleanup()
+
+    def test_download_caches_size_for_get_file_size(self):
+        path = self.client.download("batches/a/contacts.csv")
+        self.assertTrue(path.endswith(".csv"))
+        self.assertEqual(self.client.get_file_size("batches/a/contacts.csv"), os.path.getsize(path))
+        self.client.s3_client.head_object.assert_not_called()
+
+    def test_known_small_size_downloads_with_one_get(self):
+        self.client.s3_client.head_object.return_value = {"ContentLength": 11}
+        body = mock.MagicMock()
+        body.iter_chunks.return_value = [b"Nombre\n", b"Ana\n"]
+        self.client.s3_client.get_object.return_value = {"Body": body}
+
+        self.assertEqual(self.client.get_file_size("batches/a/contacts.csv"), 11)
+        path = self.client.download("batches/a/contacts.csv")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"Nombre\nAna\n")
+        self.assertEqual(self.client.get_file_size("batches/a/contacts.csv"), 11)
+        self.client.s3_client.head_object.assert_called_once()
+        self.client.s3_client.download_fileobj.assert_not_called()
+        self.client.s3_client.get_object.assert_called_once_with(
+            Bucket=self.client.bucket_name, Key="batches/a/contacts.csv", ChecksumMode="ENABLED"
+        )
+
+    def test_download_range_writes_at_its_offset(self):
+        import storage_client
+
+        body = mock.MagicMock()
+        body.iter_chunks.return_value = [b"Ana\n"]
+        worker_client = mock.MagicMock()
+        worker_client.get_object.return_value = {"Body": body}
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.unlink, path)
+        with open(path, "wb") as f:
+            f.write(b"Nombre\n....")
+
+        with mock.patch.object(storage_client, "_worker_s3_client", worker_client):
+            written = storage_client._download_range(("files", "batches/a/big.csv", path, 7, 10, '"abc"'))
+        self.assertEqual(written, 4)
+        worker_client.get_object.assert_called_once_with(
+            Bucket="files", Key="batches/a/big.csv", Range="bytes=7-10", IfMatch='"abc"'
+        )
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"Nombre\nAna\n")
+
+    def test_known_large_size_preallocates_before_multipart_download(self):
+        size = self.client._transfer_config.multipart_threshold
+        # A stale cached size is re-checked with a HEAD before preallocating
+        self.client._meta_cache["batches/a/big.csv"] = {"ContentLength": size * 4}
+        self.client.s3_client.head_object.return_value = {"ContentLength": size, "ETag": '"abc"'}
+        sizes_seen = []
+
+        def _fake_download(Bucket, Key, Fileobj, **kwargs):
+            sizes_seen.append(os.fstat(Fileobj.fileno()).st_size)
+            Fileobj.seek(size - 1)
+            Fileobj.write(b"\n")
+
+        self.client.s3_client.download_fileobj.side_effect = _fake_download
+        path = self.client.download("batches/a/big.csv")
+        self.assertEqual(sizes_seen, [size])
+        self.assertEqual(os.path.getsize(path), size)
+
+    def test_cleanup_forgets_cached_metadata(self):
+        path = self.client.download("batches/a/contacts.csv")
+        self.client.cleanup(path)
+        self.assertEqual(self.client._meta_cache, {})
+
+        self.client.s3_client.head_object.return_value = {"ContentLength": 10}
+        self.client.get_file_size("batches/a/other.csv")
+        self.client.cleanup()
+        self.assertEqual(self.client._meta_cache, {})
+
+    def test_cleanup_removes_temp_directory_and_is_idempotent(self):
+        paths = [self.client.download("batches/a/one.csv"), self.client.download("batches/a/two.csv")]
+        tmp_dir = os.path.dirname(paths[0])
+        self.client.cleanup()
+        self.client.cleanup()
+        self.assertFalse(os.path.exists(tmp_dir))
+        self.assertEqual(self.client.temp_files, set())
+        self.assertTrue(os.path.exists(self.client.download("batches/a/three.csv")))
+
+    def test_colocated_endpoint_raises_multipart_threshold(self):
+        from storage_client import MB, _build_transfer_config
+
+        with mock.patch.dict(os.environ, {"SEAWEEDFS_COLOCATED": "1"}):
+            self.assertEqual(_build_transfer_config().multipart_threshold, 1024 * MB)
+        with mock.patch.dict(os.environ, {"SEAWEEDFS_COLOCATED": "1", "S3_MULTIPART_THRESHOLD_MB": "32"}):
+            self.assertEqual(_build_transfer_config().multipart_threshold, 32 * MB)
+
+    def test_crt_transfer_client_requires_awscrt(self):
+        from storage_client import _build_transfer_config
+
+        with mock.patch.dict(os.environ, {"S3_TRANSFER_CLIENT": "crt"}), \
+                mock.patch("storage_client.HAS_CRT", False):
+            self.assertEqual(_build_transfer_config().preferred_transfer_client, "classic")
+        with mock.patch.dict(os.environ, {"S3_TRANSFER_CLIENT": "crt"}), \
+                mock.patch("storage_client.HAS_CRT", True):
+            self.assertEqual(_build_transfer_config().preferred_transfer_client, "crt")
+
+    def test_s3_client_is_built_on_first_use(self):
+        with mock.patch("storage_client._build_s3_client") as build:
+            client = StorageClient("seaweedfs")
+            build.assert_not_called()
+            self.assertIs(client.s3_client, build.return_value)
+            self.assertIs(client.s3_client, build.return_value)
+            build.assert_called_once()
+            self.assertIsNone(StorageClient("local").s3_client)
+
+    def test_context_manager_cleans_up_downloads(self):
+        with StorageClient("seaweedfs") as client:
+            client.s3_client = self.client.s3_client
+            path = client.download("batches/a/contacts.csv")
+            self.assertTrue(os.path.exists(path))
+        self.assertFalse(os.path.exists(path))
+
+    def test_get_storage_client_is_shared_per_mode(self):
+        self.assertIs(get_storage_client("local"), get_storage_client("local"))
+        self.assertIsNot(get_storage_client("local"), get_storage_client("seaweedfs"))
+
+
+class LocalStorageClientTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        with mock.patch.dict(os.environ, {"LOCAL_STORAGE_PATH": self.root}):
+            self.client = StorageClient("local")
+        with open(os.path.join(self.root, "contacts.csv"), "wb") as f:
+            f.write(b"Nombre\nAna\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_download_returns_local_path_and_caches_size(self):
+        self.assertEqual(self.client.download("contacts.csv"), os.path.join(self.root, "contacts.csv"))
+        self.assertEqual(self.client.get_file_size("contacts.csv"), 11)
+        self.assertEqual(self.client.get_file_size("missing.csv"), 0)
+        with self.assertRaises(FileNotFoundError):
+            self.client.download("missing.csv")
+
 
 class FileParserFlexibilityTests(unittest.TestCase):
     def setUp(self):
@@ -214,6 +658,66 @@ class FileParserFlexibilityTests(unittest.TestCase):
         self._tmp_paths.append(path)
         return path
 
+    def test_detect_encoding_bom_and_sample_boundary(self):
+        path = self._write_tmp("\ufeffNombre,Correo\nAna,ana@example.com\n", ".csv")
+        self.assertEqual(self.parser.detect_encoding(path), "utf-8-sig")
+        df = self.parser.parse_file(path)
+        self.assertEqual(list(df.columns), ["Nombre", "Correo"])
+
+        # A two-byte character split by the sample boundary is still UTF-8
+        from file_parser import ENCODING_SAMPLE_BYTES
+        path = self._write_tmp("a" * (ENCODING_SAMPLE_BYTES - 1) + "ñ", ".txt")
+        self.assertEqual(self.parser.detect_encoding(path), "utf-8")
+
+    def test_iter_chunks_streams_csv_in_order(self):
+        content = (
+            "BASE DE DATOS GENERAL\n"
+            "Nombre,Correo,Telefono\n"
+            "Ana Gomez,ana@example.com,22221111\n"
+            "Luis Mora,luis@example.com,22223333\n"
+            "Eva Solis,eva@example.com,22224444\n"
+        )
+        path = self._write_tmp(content, ".csv")
+        chunks = list(self.parser.iter_chunks(path, chunksize=2))
+        self.assertEqual([len(c) for c in chunks], [2, 1])
+        pd.testing.assert_frame_equal(pd.concat(chunks), self.parser.parse_file(path))
+
+    def test_csv_phone_columns_are_read_as_text(self):
+        content = (
+            "Nombre,Telefono,Edad\n"
+            "Ana Gomez,022221111,30\n"
+            "Luis Mora,,\n"
+        )
+        path = self._write_tmp(content, ".csv")
+        df = self.parser.parse_file(path)
+        self.assertEqual(df["Telefono"].iloc[0], "022221111")
+        self.assertTrue(pd.isna(df["Telefono"].iloc[1]))
+
+    def test_xlsx_single_pass_matches_read_excel(self):
+        import openpyxl
+
+        fd, path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        self._tmp_paths.append(path)
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["BASE DE DATOS"])
+        sheet.append(["Nombre", "Telefono", "Correo"])
+        sheet.append(["Ana Gomez", 22221111, "ana@example.com"])
+        sheet.append(["Luis Mora", None, "luis@example.com"])
+        workbook.save(path)
+
+        df = self.parser.parse_file(path)
+        self.assertEqual(list(df.columns), ["Nombre", "Telefono", "Correo"])
+        self.assertEqual(df["Telefono"].iloc[0], "22221111")
+        pd.testing.assert_frame_equal(df, self.parser._read_excel(path))
+        self.assertEqual([len(c) for c in self.parser.iter_chunks(path, chunksize=1)], [1, 1])
+
+    def test_json_records_parse(self):
+        path = self._write_tmp('\ufeff[{"Nombre": "José Mora", "Telefono": 22221111}]', ".json")
+        df = self.parser.parse_file(path)
+        self.assertEqual(df.to_dict("records"), [{"Nombre": "José Mora", "Telefono": 22221111}])
+
     def test_csv_with_preamble_row_skips_to_real_header(self):
         content = (
             "BASE DE DATOS GENERAL\n"